@@ -0,0 +1,23 @@
+"""Helpers shared by the httpx and curl backends."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+# Optional fingerprint import, resolved once at import time rather than
+# on every header-generator lookup
+create_header_generator: Callable[..., Any] | None
+try:
+    from .._fingerprint import create_header_generator
+except ImportError:
+    create_header_generator = None
+
+
+def cookie_dict(cookies: Any) -> dict[str, str]:
+    """Flatten a response cookie jar into a name -> value dict.
+
+    Reads the jar in one pass; the Mapping interface rescans the jar per
+    name and raises on a name set for several domains (last one wins here).
+    """
+    return {cookie.name: cookie.value for cookie in cookies.jar}
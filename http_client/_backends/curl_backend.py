@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Literal
+from collections.abc import Iterator
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as _package_version
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from ..models import Request, Response, TransportError
+from ._common import cookie_dict, create_header_generator
 
 # Optional curl_cffi import
 try:
@@ -17,6 +21,45 @@ except ImportError:
     AsyncSession = None
     CurlHttpVersion = None
 
+# Imported apart from the block above so the type checker never sees
+# the CurlOpt class rebound to None
+if TYPE_CHECKING or CURL_AVAILABLE:
+    from curl_cffi import CurlOpt
+else:
+    CurlOpt = None
+
+if TYPE_CHECKING:
+    from curl_cffi.requests.session import HttpMethod
+
+
+def _version_tuple(version: str) -> tuple[int, ...]:
+    """Parse leading numeric components of a version string."""
+    parts = []
+    for part in version.split(".")[:3]:
+        digits = ""
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        parts.append(int(digits or 0))
+    return tuple(parts)
+
+
+def _installed_version(package: str) -> str:
+    """Installed distribution version, or "0" if it is not installed."""
+    try:
+        return _package_version(package)
+    except PackageNotFoundError:
+        return "0"
+
+
+# curl_cffi < 0.7.0 AsyncSession can fail concurrent requests on a reused
+# connection (curl error 18). Forcing a fresh connection works around it;
+# newer versions fixed the bug, so keep connection reuse there.
+CURL_NEEDS_FRESH_CONNECT = (
+    CURL_AVAILABLE and _version_tuple(_installed_version("curl_cffi")) < (0, 7, 0)
+)
+
 
 class CurlBackend:
     """curl_cffi wrapper with browser fingerprinting support.
@@ -24,6 +67,20 @@ class CurlBackend:
     Provides TLS fingerprinting via curl_cffi's impersonate feature.
     """
 
+    __slots__ = (
+        "_timeout",
+        "_verify_ssl",
+        "_follow_redirects",
+        "_profile_name",
+        "_impersonate",
+        "_http_version",
+        "_curl_options",
+        "_sync_session",
+        "_async_session",
+        "_header_generator",
+        "_last_prepared_headers",
+    )
+
     def __init__(
         self,
         profile: str = "chrome_120",
@@ -31,6 +88,7 @@ class CurlBackend:
         verify_ssl: bool = True,
         follow_redirects: bool = True,
         http_version: Literal["1.1", "2"] | None = None,
+        curl_options: dict[Any, Any] | None = None,
     ):
         """Initialize curl backend.
 
@@ -40,6 +98,7 @@ class CurlBackend:
             verify_ssl: Whether to verify SSL certificates.
             follow_redirects: Whether to follow redirects.
             http_version: HTTP version ("1.1" or "2"). None for auto.
+            curl_options: Extra CurlOpt options applied to every session.
 
         Raises:
             ImportError: If curl_cffi is not installed.
@@ -63,6 +122,13 @@ class CurlBackend:
         elif http_version == "2":
             self._http_version = CurlHttpVersion.V2_0
 
+        # Extra curl options (user options override the workaround default)
+        self._curl_options: dict[Any, Any] = {}
+        if CURL_NEEDS_FRESH_CONNECT:
+            self._curl_options[CurlOpt.FRESH_CONNECT] = True
+        if curl_options:
+            self._curl_options.update(curl_options)
+
         # Lazy-initialized sessions
         self._sync_session: Session | None = None
         self._async_session: AsyncSession | None = None
@@ -106,17 +172,12 @@ class CurlBackend:
         Uses browserforge by default for realistic headers, with fallback
         to static profiles if browserforge is not installed.
         """
-        if self._header_generator is None:
-            try:
-                from .._fingerprint import create_header_generator
-                # Use browserforge by default, with fallback to static profiles
-                self._header_generator = create_header_generator(
-                    use_browserforge=True,
-                    browser=self._get_browser_from_profile(),
-                )
-            except ImportError:
-                # Fingerprint module not available, use None
-                pass
+        if self._header_generator is None and create_header_generator is not None:
+            # Use browserforge by default, with fallback to static profiles
+            self._header_generator = create_header_generator(
+                use_browserforge=True,
+                browser=self._get_browser_from_profile(),
+            )
         return self._header_generator
 
     def _get_sync_session(self) -> Session:
@@ -126,6 +187,7 @@ class CurlBackend:
                 impersonate=self._impersonate,
                 timeout=self._timeout,
                 verify=self._verify_ssl,
+                curl_options=self._curl_options or None,
             )
         return self._sync_session
 
@@ -136,6 +198,7 @@ class CurlBackend:
                 impersonate=self._impersonate,
                 timeout=self._timeout,
                 verify=self._verify_ssl,
+                curl_options=self._curl_options or None,
             )
         return self._async_session
 
@@ -226,7 +289,7 @@ class CurlBackend:
                 data=data,
                 json=json,
                 cookies=cookies,
-                timeout=timeout or self._timeout,
+                timeout=timeout if timeout is not None else self._timeout,
                 proxies={"all": proxy} if proxy else None,
                 allow_redirects=self._follow_redirects,
                 http_version=self._http_version,
@@ -292,7 +355,7 @@ class CurlBackend:
                 data=data,
                 json=json,
                 cookies=cookies,
-                timeout=timeout or self._timeout,
+                timeout=timeout if timeout is not None else self._timeout,
                 proxies={"all": proxy} if proxy else None,
                 allow_redirects=self._follow_redirects,
                 http_version=self._http_version,
@@ -312,6 +375,92 @@ class CurlBackend:
         except Exception as e:
             raise TransportError(str(e), original_error=e) from e
 
+    def stream_sync(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+        data: Any = None,
+        json: Any = None,
+        cookies: dict[str, str] | None = None,
+        timeout: float | None = None,
+        proxy: str | None = None,
+        stealth: bool = False,
+        chunk_size: int = 65536,  # noqa: ARG002 - parity with HttpxBackend
+    ) -> tuple[Response, Iterator[bytes]]:
+        """Start a streaming request without buffering the body.
+
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            url: Request URL.
+            headers: Request headers.
+            params: URL query parameters.
+            data: Form data.
+            json: JSON body.
+            cookies: Request cookies.
+            timeout: Request-specific timeout.
+            proxy: Proxy URL.
+            stealth: Apply browser fingerprinting headers.
+            chunk_size: Ignored; curl_cffi yields chunks as libcurl delivers
+                them. Accepted for parity with HttpxBackend.stream_sync().
+
+        Returns:
+            Tuple of (Response with empty content, iterator of body chunks).
+            The connection is released when the iterator is exhausted or closed.
+
+        Raises:
+            TransportError: On connection/transport errors.
+        """
+        final_headers = self._prepare_headers(url, method, headers, stealth)
+        self._last_prepared_headers = final_headers
+
+        try:
+            session = self._get_sync_session()
+            resp = session.request(
+                method=cast("HttpMethod", method),
+                url=url,
+                headers=final_headers or None,
+                params=params,
+                data=data,
+                json=json,
+                cookies=cookies,
+                timeout=timeout if timeout is not None else self._timeout,
+                proxies={"all": proxy} if proxy else None,
+                allow_redirects=self._follow_redirects,
+                http_version=self._http_version,
+                stream=True,
+            )
+        except Exception as e:
+            raise TransportError(str(e), original_error=e) from e
+
+        def iter_chunks() -> Iterator[bytes]:
+            try:
+                yield from resp.iter_content()
+            except Exception as e:
+                raise TransportError(str(e), original_error=e) from e
+            finally:
+                resp.close()
+
+        return Response(
+            status_code=resp.status_code,
+            headers=dict(resp.headers.items()),
+            content=b"",
+            url=str(resp.url),
+            cookies=cookie_dict(resp.cookies),
+            request=Request(
+                method=method,
+                url=url,
+                headers=final_headers,
+                params=params,
+                data=data,
+                json=json,
+                cookies=cookies,
+                timeout=timeout,
+                proxy=proxy,
+            ),
+        ), iter_chunks()
+
     def _convert_response(
         self,
         resp: Any,
@@ -343,14 +492,11 @@ class CurlBackend:
             Response object.
         """
         # Extract cookies from response
-        resp_cookies = {}
-        if hasattr(resp, "cookies"):
-            for name, value in resp.cookies.items():
-                resp_cookies[name] = value
+        resp_cookies = cookie_dict(resp.cookies) if hasattr(resp, "cookies") else {}
 
         return Response(
             status_code=resp.status_code,
-            headers=dict(resp.headers),
+            headers=dict(resp.headers.items()),
             content=resp.content,
             url=str(resp.url),
             cookies=resp_cookies,
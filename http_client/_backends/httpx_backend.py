@@ -2,11 +2,29 @@
 
 from __future__ import annotations
 
+import contextlib
+from collections import OrderedDict
+from collections.abc import Iterator
 from typing import Any, Literal
 
 import httpx
 
 from ..models import Request, Response, TransportError
+from ._common import cookie_dict, create_header_generator
+
+# Max proxied clients cached per backend; the least recently used one is
+# retired when a new proxy would exceed this
+_MAX_PROXY_CLIENTS = 32
+
+
+def _body_kwargs(data: Any) -> dict[str, Any]:
+    """Map a request body onto httpx arguments.
+
+    httpx deprecates raw bytes/str in data=, so those go through content=.
+    """
+    if isinstance(data, (bytes, str)):
+        return {"content": data}
+    return {"data": data}
 
 
 class HttpxBackend:
@@ -16,6 +34,22 @@ class HttpxBackend:
     Supports optional browserforge header generation for stealth mode.
     """
 
+    __slots__ = (
+        "_timeout",
+        "_verify_ssl",
+        "_follow_redirects",
+        "_profile_name",
+        "_http2",
+        "_sync_client",
+        "_async_client",
+        "_proxy_sync_clients",
+        "_proxy_async_clients",
+        "_retired_sync_clients",
+        "_retired_async_clients",
+        "_header_generator",
+        "_last_prepared_headers",
+    )
+
     def __init__(
         self,
         timeout: float = 30.0,
@@ -41,6 +75,14 @@ class HttpxBackend:
         self._http2 = http_version != "1.1"
         self._sync_client: httpx.Client | None = None
         self._async_client: httpx.AsyncClient | None = None
+        # Proxied clients keyed by proxy URL in LRU order, kept open for
+        # connection reuse
+        self._proxy_sync_clients: OrderedDict[str, httpx.Client] = OrderedDict()
+        self._proxy_async_clients: OrderedDict[str, httpx.AsyncClient] = OrderedDict()
+        # Evicted proxied clients; another caller may still be sending on
+        # one, so they are only closed by close_sync()/close_async()
+        self._retired_sync_clients: list[httpx.Client] = []
+        self._retired_async_clients: list[httpx.AsyncClient] = []
         self._header_generator = None
         self._last_prepared_headers: dict[str, str] = {}
 
@@ -54,15 +96,11 @@ class HttpxBackend:
         Uses browserforge by default for realistic headers, with fallback
         to static profiles if browserforge is not installed.
         """
-        if self._header_generator is None:
-            try:
-                from .._fingerprint import create_header_generator
-                self._header_generator = create_header_generator(
-                    use_browserforge=True,
-                    browser=self._get_browser_from_profile(),
-                )
-            except ImportError:
-                pass
+        if self._header_generator is None and create_header_generator is not None:
+            self._header_generator = create_header_generator(
+                use_browserforge=True,
+                browser=self._get_browser_from_profile(),
+            )
         return self._header_generator
 
     def _prepare_headers(
@@ -121,6 +159,62 @@ class HttpxBackend:
             )
         return self._async_client
 
+    def _get_proxy_sync_client(self, proxy: str) -> httpx.Client:
+        """Get or create the sync client for a proxy URL.
+
+        Retires the least recently used client beyond _MAX_PROXY_CLIENTS.
+        """
+        clients = self._proxy_sync_clients
+        client = clients.get(proxy)
+        if client is not None:
+            # Another thread may have evicted it meanwhile
+            with contextlib.suppress(KeyError):
+                clients.move_to_end(proxy)
+            return client
+
+        new_client = httpx.Client(
+            timeout=self._timeout,
+            verify=self._verify_ssl,
+            http2=self._http2,
+            follow_redirects=self._follow_redirects,
+            proxy=proxy,
+        )
+        client = clients.setdefault(proxy, new_client)
+        if client is not new_client:
+            # Another thread registered one first
+            new_client.close()
+            return client
+        while len(clients) > _MAX_PROXY_CLIENTS:
+            try:
+                _, evicted = clients.popitem(last=False)
+            except KeyError:
+                break
+            self._retired_sync_clients.append(evicted)
+        return client
+
+    def _get_proxy_async_client(self, proxy: str) -> httpx.AsyncClient:
+        """Get or create the async client for a proxy URL.
+
+        Retires the least recently used client beyond _MAX_PROXY_CLIENTS.
+        """
+        clients = self._proxy_async_clients
+        client = clients.get(proxy)
+        if client is not None:
+            clients.move_to_end(proxy)
+            return client
+
+        client = clients[proxy] = httpx.AsyncClient(
+            timeout=self._timeout,
+            verify=self._verify_ssl,
+            http2=self._http2,
+            follow_redirects=self._follow_redirects,
+            proxy=proxy,
+        )
+        if len(clients) > _MAX_PROXY_CLIENTS:
+            _, evicted = clients.popitem(last=False)
+            self._retired_async_clients.append(evicted)
+        return client
+
     def request_sync(
         self,
         method: str,
@@ -145,7 +239,7 @@ class HttpxBackend:
             json: JSON body.
             cookies: Request cookies.
             timeout: Request-specific timeout.
-            proxy: Proxy URL (creates new client if provided).
+            proxy: Proxy URL (uses a client kept per proxy URL).
             stealth: Apply browser fingerprinting headers.
 
         Returns:
@@ -159,35 +253,17 @@ class HttpxBackend:
 
         try:
             # Use proxy-specific client if proxy provided
-            if proxy:
-                with httpx.Client(
-                    timeout=timeout or self._timeout,
-                    verify=self._verify_ssl,
-                    http2=self._http2,
-                    follow_redirects=self._follow_redirects,
-                    proxy=proxy,
-                ) as client:
-                    resp = client.request(
-                        method=method,
-                        url=url,
-                        headers=final_headers or None,
-                        params=params,
-                        data=data,
-                        json=json,
-                        cookies=cookies,
-                    )
-            else:
-                client = self._get_sync_client()
-                resp = client.request(
-                    method=method,
-                    url=url,
-                    headers=final_headers or None,
-                    params=params,
-                    data=data,
-                    json=json,
-                    cookies=cookies,
-                    timeout=timeout,
-                )
+            client = self._get_proxy_sync_client(proxy) if proxy else self._get_sync_client()
+            resp = client.request(
+                method=method,
+                url=url,
+                headers=final_headers or None,
+                params=params,
+                **_body_kwargs(data),
+                json=json,
+                cookies=cookies,
+                timeout=timeout if timeout is not None else self._timeout,
+            )
 
             return self._convert_response(
                 resp, method, url,
@@ -227,7 +303,7 @@ class HttpxBackend:
             json: JSON body.
             cookies: Request cookies.
             timeout: Request-specific timeout.
-            proxy: Proxy URL (creates new client if provided).
+            proxy: Proxy URL (uses a client kept per proxy URL).
             stealth: Apply browser fingerprinting headers.
 
         Returns:
@@ -241,35 +317,17 @@ class HttpxBackend:
 
         try:
             # Use proxy-specific client if proxy provided
-            if proxy:
-                async with httpx.AsyncClient(
-                    timeout=timeout or self._timeout,
-                    verify=self._verify_ssl,
-                    http2=self._http2,
-                    follow_redirects=self._follow_redirects,
-                    proxy=proxy,
-                ) as client:
-                    resp = await client.request(
-                        method=method,
-                        url=url,
-                        headers=final_headers or None,
-                        params=params,
-                        data=data,
-                        json=json,
-                        cookies=cookies,
-                    )
-            else:
-                client = self._get_async_client()
-                resp = await client.request(
-                    method=method,
-                    url=url,
-                    headers=final_headers or None,
-                    params=params,
-                    data=data,
-                    json=json,
-                    cookies=cookies,
-                    timeout=timeout,
-                )
+            client = self._get_proxy_async_client(proxy) if proxy else self._get_async_client()
+            resp = await client.request(
+                method=method,
+                url=url,
+                headers=final_headers or None,
+                params=params,
+                **_body_kwargs(data),
+                json=json,
+                cookies=cookies,
+                timeout=timeout if timeout is not None else self._timeout,
+            )
 
             return self._convert_response(
                 resp, method, url,
@@ -285,6 +343,90 @@ class HttpxBackend:
         except httpx.HTTPError as e:
             raise TransportError(str(e), original_error=e) from e
 
+    def stream_sync(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+        data: Any = None,
+        json: Any = None,
+        cookies: dict[str, str] | None = None,
+        timeout: float | None = None,
+        proxy: str | None = None,
+        stealth: bool = False,
+        chunk_size: int = 65536,
+    ) -> tuple[Response, Iterator[bytes]]:
+        """Start a streaming request without buffering the body.
+
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            url: Request URL.
+            headers: Request headers.
+            params: URL query parameters.
+            data: Form data.
+            json: JSON body.
+            cookies: Request cookies.
+            timeout: Request-specific timeout.
+            proxy: Proxy URL (uses a client kept per proxy URL).
+            stealth: Apply browser fingerprinting headers.
+            chunk_size: Maximum size of each yielded chunk in bytes.
+
+        Returns:
+            Tuple of (Response with empty content, iterator of body chunks).
+            The connection is released when the iterator is exhausted or closed.
+
+        Raises:
+            TransportError: On connection/transport errors.
+        """
+        final_headers = self._prepare_headers(url, method, headers, stealth)
+        self._last_prepared_headers = final_headers
+
+        # Use proxy-specific client if proxy provided
+        client = self._get_proxy_sync_client(proxy) if proxy else self._get_sync_client()
+
+        try:
+            httpx_request = client.build_request(
+                method=method,
+                url=url,
+                headers=final_headers or None,
+                params=params,
+                **_body_kwargs(data),
+                json=json,
+                cookies=cookies,
+                timeout=timeout if timeout is not None else self._timeout,
+            )
+            resp = client.send(httpx_request, stream=True)
+        except httpx.HTTPError as e:
+            raise TransportError(str(e), original_error=e) from e
+
+        def iter_chunks() -> Iterator[bytes]:
+            try:
+                yield from resp.iter_bytes(chunk_size)
+            except httpx.HTTPError as e:
+                raise TransportError(str(e), original_error=e) from e
+            finally:
+                resp.close()
+
+        return Response(
+            status_code=resp.status_code,
+            headers=dict(resp.headers.items()),
+            content=b"",
+            url=str(resp.url),
+            cookies=cookie_dict(resp.cookies),
+            request=Request(
+                method=method,
+                url=url,
+                headers=final_headers,
+                params=params,
+                data=data,
+                json=json,
+                cookies=cookies,
+                timeout=timeout,
+                proxy=proxy,
+            ),
+        ), iter_chunks()
+
     def _convert_response(
         self,
         httpx_resp: httpx.Response,
@@ -317,10 +459,10 @@ class HttpxBackend:
         """
         return Response(
             status_code=httpx_resp.status_code,
-            headers=dict(httpx_resp.headers),
+            headers=dict(httpx_resp.headers.items()),
             content=httpx_resp.content,
             url=str(httpx_resp.url),
-            cookies=dict(httpx_resp.cookies),
+            cookies=cookie_dict(httpx_resp.cookies),
             elapsed=httpx_resp.elapsed.total_seconds(),
             request=Request(
                 method=method,
@@ -337,13 +479,25 @@ class HttpxBackend:
         )
 
     def close_sync(self) -> None:
-        """Close sync client."""
+        """Close sync clients."""
         if self._sync_client:
             self._sync_client.close()
             self._sync_client = None
+        for client in self._proxy_sync_clients.values():
+            client.close()
+        self._proxy_sync_clients.clear()
+        for client in self._retired_sync_clients:
+            client.close()
+        self._retired_sync_clients.clear()
 
     async def close_async(self) -> None:
-        """Close async client."""
+        """Close async clients."""
         if self._async_client:
             await self._async_client.aclose()
             self._async_client = None
+        for client in self._proxy_async_clients.values():
+            await client.aclose()
+        self._proxy_async_clients.clear()
+        for client in self._retired_async_clients:
+            await client.aclose()
+        self._retired_async_clients.clear()
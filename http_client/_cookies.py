@@ -1,15 +1,47 @@
-"""Thread-safe and async-safe cookie storage."""
+"""Thread-safe cookie storage."""
 
 from __future__ import annotations
 
-import asyncio
+import sys
 import threading
 import time
 from dataclasses import dataclass
-from urllib.parse import urlparse
+from functools import lru_cache
+from urllib.parse import urlsplit
 
+# Max number of (domain, path, secure) lookups cached by CookieStore
+_URL_CACHE_SIZE = 256
 
-@dataclass
+# Max number of distinct request URLs whose parse results are cached
+_URL_PARSE_CACHE_SIZE = 4096
+
+# Max number of distinct cookie domains whose matching forms are cached
+_DOMAIN_FORMS_CACHE_SIZE = 1024
+
+# Minimum time between expired-cookie sweeps on the lookup path (30s, in ns)
+_CLEANUP_INTERVAL_NS = 30_000_000_000
+
+
+@lru_cache(maxsize=_URL_PARSE_CACHE_SIZE)
+def _split_url(url: str) -> tuple[str, str, bool]:
+    """Split URL into (domain, path, is_secure) for cookie matching."""
+    parsed = urlsplit(url)
+    return parsed.netloc.lower(), parsed.path or "/", parsed.scheme.lower() == "https"
+
+
+@lru_cache(maxsize=_DOMAIN_FORMS_CACHE_SIZE)
+def _domain_forms(domain: str) -> tuple[str, str, str]:
+    """Matching forms of a cookie domain, built once per distinct domain.
+
+    Returns (lowercased, without the leading dot, "." + that) for the
+    exact and subdomain checks in Cookie.matches_domain.
+    """
+    lowered = domain if domain.islower() else domain.lower()
+    bare = lowered.lstrip(".")
+    return lowered, bare, "." + bare
+
+
+@dataclass(slots=True)
 class Cookie:
     """Cookie representation.
 
@@ -40,16 +72,13 @@ class Cookie:
 
     def matches_domain(self, domain: str) -> bool:
         """Check if cookie matches the given domain."""
-        domain = domain.lower()
-        cookie_domain = self.domain.lower()
-
-        if domain == cookie_domain:
-            return True
-
-        if cookie_domain.startswith("."):
-            return domain.endswith(cookie_domain) or domain == cookie_domain[1:]
+        if not domain.islower():
+            domain = domain.lower()
 
-        return domain.endswith("." + cookie_domain)
+        # Looked up per call rather than stored, so reassigning self.domain
+        # cannot leave stale forms behind
+        domain_lower, bare_domain, domain_suffix = _domain_forms(self.domain)
+        return domain in (bare_domain, domain_lower) or domain.endswith(domain_suffix)
 
     def matches_path(self, path: str) -> bool:
         """Check if cookie matches the given path."""
@@ -58,56 +87,115 @@ class Cookie:
         return path.startswith(self.path)
 
 
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _domain_keys(domain: str) -> tuple[str, ...]:
+    """Store keys whose cookies can match domain, least specific first.
+
+    For "a.example.com" these are ("com", "example.com", "a.example.com"),
+    i.e. every key k with domain == k or domain ending in "." + k.
+    """
+    keys = [domain]
+    dot = domain.find(".")
+    while dot != -1:
+        keys.append(domain[dot + 1:])
+        dot = domain.find(".", dot + 1)
+    return tuple(reversed(keys))
+
+
 class CookieStore:
-    """Thread-safe and async-safe cookie storage with per-domain organization.
+    """Thread-safe cookie storage with per-domain organization.
 
-    Uses dual-lock pattern:
-    - threading.Lock for thread safety
-    - asyncio.Lock for async task safety (lazy initialized)
+    A single threading.Lock guards the store. No critical section awaits,
+    so the async methods take the same lock: a task holding it never
+    yields to another task on the event loop.
     """
 
+    __slots__ = ("_cookies", "_thread_lock", "_last_cleanup", "_url_cache")
+
     def __init__(self):
         """Initialize empty cookie store."""
         self._cookies: dict[str, dict[str, Cookie]] = {}
         self._thread_lock = threading.Lock()
-        self._async_lock: asyncio.Lock | None = None
-
-    def _get_async_lock(self) -> asyncio.Lock:
-        """Lazily initialize async lock within event loop context."""
-        with self._thread_lock:
-            if self._async_lock is None:
-                try:
-                    self._async_lock = asyncio.Lock()
-                except RuntimeError as e:
-                    raise RuntimeError(
-                        "Cannot create asyncio.Lock outside of async context."
-                    ) from e
-            return self._async_lock
+        self._last_cleanup = 0  # time.monotonic_ns() of the last sweep
+        # (domain, path, is_secure) -> (matched cookies, earliest expiry)
+        self._url_cache: dict[tuple[str, str, bool], tuple[dict[str, str], float | None]] = {}
 
     def _normalize_domain(self, domain: str) -> str:
-        """Normalize domain for storage key."""
+        """Normalize domain for storage key (interned, shared by its cookies)."""
         domain = domain.lower()
         if domain.startswith("."):
             domain = domain[1:]
-        return domain
+        return sys.intern(domain)
 
     def _get_domain_from_url(self, url: str) -> str:
-        """Extract domain from URL."""
-        parsed = urlparse(url)
-        return parsed.netloc.lower()
-
-    def _cleanup_expired(self) -> None:
-        """Remove expired cookies. Must be called under lock."""
+        """Extract domain from URL (interned, shared by its cookies)."""
+        return sys.intern(_split_url(url)[0])
+
+    def _cleanup_expired(self, force: bool = False) -> None:
+        """Remove expired cookies. Must be called under lock.
+
+        Unless forced, runs at most once per _CLEANUP_INTERVAL_NS; lookups
+        skip expired cookies themselves, so this only reclaims memory.
+        """
+        now = time.monotonic_ns()
+        if not force and now - self._last_cleanup < _CLEANUP_INTERVAL_NS:
+            return
+        self._last_cleanup = now
+        wall_now = time.time()
         for domain in list(self._cookies.keys()):
             domain_cookies = self._cookies[domain]
             expired = [
-                name for name, cookie in domain_cookies.items() if cookie.is_expired
+                name
+                for name, cookie in domain_cookies.items()
+                if cookie.expires is not None and wall_now > cookie.expires
             ]
             for name in expired:
                 del domain_cookies[name]
             if not domain_cookies:
                 del self._cookies[domain]
 
+    def _lookup(self, url: str) -> dict[str, str]:
+        """Get cookies applicable to URL. Must be called under lock.
+
+        Results are cached per (domain, path, secure) until the store is
+        modified or one of the matched cookies expires.
+        """
+        key = _split_url(url)
+        now = time.time()
+        cached = self._url_cache.get(key)
+        if cached is not None:
+            cached_result, expires = cached
+            if expires is None or now <= expires:
+                return dict(cached_result)
+
+        domain, path, is_secure = key
+        self._cleanup_expired()
+
+        result: dict[str, str] = {}
+        earliest: float | None = None
+        # Only buckets keyed by the domain or a parent domain can match;
+        # more specific domains are visited last so their values win.
+        for domain_key in _domain_keys(domain):
+            domain_cookies = self._cookies.get(domain_key)
+            if not domain_cookies:
+                continue
+            for name, cookie in domain_cookies.items():
+                # One clock read per lookup rather than per cookie
+                if cookie.expires is not None and now > cookie.expires:
+                    continue
+                if not cookie.matches_path(path):
+                    continue
+                if cookie.secure and not is_secure:
+                    continue
+                result[name] = cookie.value
+                if cookie.expires is not None and (earliest is None or cookie.expires < earliest):
+                    earliest = cookie.expires
+
+        if len(self._url_cache) >= _URL_CACHE_SIZE:
+            self._url_cache.clear()
+        self._url_cache[key] = (result, earliest)
+        return dict(result)
+
     def set(
         self,
         name: str,
@@ -134,6 +222,7 @@ class CookieStore:
             if domain_key not in self._cookies:
                 self._cookies[domain_key] = {}
             self._cookies[domain_key][name] = cookie
+            self._url_cache.clear()
 
     async def set_async(
         self,
@@ -146,77 +235,27 @@ class CookieStore:
         http_only: bool = False,
     ) -> None:
         """Set a cookie (async-safe)."""
-        cookie = Cookie(
-            name=name,
-            value=value,
-            domain=domain,
-            path=path,
-            expires=expires,
-            secure=secure,
-            http_only=http_only,
-        )
-        domain_key = self._normalize_domain(domain)
-        async_lock = self._get_async_lock()
-
-        async with async_lock:
-            with self._thread_lock:
-                if domain_key not in self._cookies:
-                    self._cookies[domain_key] = {}
-                self._cookies[domain_key][name] = cookie
+        self.set(name, value, domain, path, expires, secure, http_only)
 
     def get_for_url(self, url: str) -> dict[str, str]:
         """Get cookies applicable to URL (thread-safe)."""
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        path = parsed.path or "/"
-        is_secure = parsed.scheme.lower() == "https"
-
-        result: dict[str, str] = {}
-
+        # Lock-free fast path; a cookie added concurrently is seen next call
+        if not self._cookies:
+            return {}
         with self._thread_lock:
-            self._cleanup_expired()
-
-            for domain_key, domain_cookies in self._cookies.items():
-                for name, cookie in domain_cookies.items():
-                    if cookie.is_expired:
-                        continue
-                    if not cookie.matches_domain(domain):
-                        continue
-                    if not cookie.matches_path(path):
-                        continue
-                    if cookie.secure and not is_secure:
-                        continue
-                    result[name] = cookie.value
-
-        return result
+            return self._lookup(url)
 
     async def get_for_url_async(self, url: str) -> dict[str, str]:
         """Get cookies applicable to URL (async-safe)."""
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        path = parsed.path or "/"
-        is_secure = parsed.scheme.lower() == "https"
+        return self.get_for_url(url)
 
-        result: dict[str, str] = {}
-        async_lock = self._get_async_lock()
-
-        async with async_lock:
-            with self._thread_lock:
-                self._cleanup_expired()
-
-                for domain_key, domain_cookies in self._cookies.items():
-                    for name, cookie in domain_cookies.items():
-                        if cookie.is_expired:
-                            continue
-                        if not cookie.matches_domain(domain):
-                            continue
-                        if not cookie.matches_path(path):
-                            continue
-                        if cookie.secure and not is_secure:
-                            continue
-                        result[name] = cookie.value
-
-        return result
+    @staticmethod
+    def _build_cookies(domain: str, response_cookies: dict[str, str]) -> dict[str, Cookie]:
+        """Build Cookie objects for a response (done outside the lock)."""
+        return {
+            name: Cookie(name=name, value=value, domain=domain)
+            for name, value in response_cookies.items()
+        }
 
     def update_from_response(
         self,
@@ -224,18 +263,19 @@ class CookieStore:
         response_cookies: dict[str, str],
     ) -> None:
         """Update cookies from response (thread-safe)."""
+        if not response_cookies:
+            return
         domain = self._get_domain_from_url(url)
+        new_cookies = self._build_cookies(domain, response_cookies)
 
         with self._thread_lock:
-            if domain not in self._cookies:
-                self._cookies[domain] = {}
-
-            for name, value in response_cookies.items():
-                self._cookies[domain][name] = Cookie(
-                    name=name,
-                    value=value,
-                    domain=domain,
-                )
+            domain_cookies = self._cookies.get(domain)
+            if domain_cookies is None:
+                # New domain: adopt the pre-built dict instead of copying it
+                self._cookies[domain] = new_cookies
+            else:
+                domain_cookies.update(new_cookies)
+            self._url_cache.clear()
 
     async def update_from_response_async(
         self,
@@ -243,20 +283,7 @@ class CookieStore:
         response_cookies: dict[str, str],
     ) -> None:
         """Update cookies from response (async-safe)."""
-        domain = self._get_domain_from_url(url)
-        async_lock = self._get_async_lock()
-
-        async with async_lock:
-            with self._thread_lock:
-                if domain not in self._cookies:
-                    self._cookies[domain] = {}
-
-                for name, value in response_cookies.items():
-                    self._cookies[domain][name] = Cookie(
-                        name=name,
-                        value=value,
-                        domain=domain,
-                    )
+        self.update_from_response(url, response_cookies)
 
     def delete(self, name: str, domain: str) -> bool:
         """Delete a specific cookie."""
@@ -267,6 +294,7 @@ class CookieStore:
                 del self._cookies[domain_key][name]
                 if not self._cookies[domain_key]:
                     del self._cookies[domain_key]
+                self._url_cache.clear()
                 return True
             return False
 
@@ -276,16 +304,18 @@ class CookieStore:
 
         with self._thread_lock:
             self._cookies.pop(domain_key, None)
+            self._url_cache.clear()
 
     def clear_all(self) -> None:
         """Clear all cookies."""
         with self._thread_lock:
             self._cookies.clear()
+            self._url_cache.clear()
 
     def get_all(self) -> dict[str, dict[str, str]]:
         """Get all cookies organized by domain."""
         with self._thread_lock:
-            self._cleanup_expired()
+            self._cleanup_expired(force=True)
             return {
                 domain: {name: cookie.value for name, cookie in cookies.items()}
                 for domain, cookies in self._cookies.items()
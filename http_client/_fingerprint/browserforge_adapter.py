@@ -18,9 +18,11 @@ Usage:
 
 from __future__ import annotations
 
+import random
 from typing import Any
 
-from .headers import merge_headers_case_insensitive
+from .headers import HeaderGenerator, merge_headers_case_insensitive
+from .profiles import get_profile
 
 # Try to import browserforge
 try:
@@ -204,8 +206,6 @@ class BrowserForgeHeaderGenerator:
 
     def _create_generator(self, os_choice: str | None = None):
         """Create a new browserforge generator with specified OS."""
-        import random
-
         # Pick random OS from options for equal distribution
         if os_choice is None:
             if isinstance(self._os_options, list):
@@ -293,9 +293,6 @@ def create_header_generator(
         return BrowserForgeHeaderGenerator(browser=browser, **kwargs)
 
     # Fall back to built-in
-    from .headers import HeaderGenerator
-    from .profiles import get_profile
-
     # Map browser name to profile
     profile_map = {
         "chrome": "chrome_120",
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+from functools import lru_cache
 from typing import Literal
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from .profiles import BrowserProfile, get_profile
 
 
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Return the netloc of a URL (cached; raises ValueError if malformed)."""
+    return urlsplit(url).netloc
+
+
 def merge_headers_case_insensitive(
     base_headers: dict[str, str],
     custom_headers: dict[str, str] | None,
@@ -184,7 +191,7 @@ class HeaderGenerator:
             Dict of Sec-Fetch headers.
         """
         try:
-            parsed = urlparse(url)
+            netloc = _netloc(url)
         except Exception:
             # If URL parsing fails, use safe defaults
             return {
@@ -197,11 +204,11 @@ class HeaderGenerator:
         sec_fetch_site = "none"
         if self._last_referer:
             try:
-                last_parsed = urlparse(self._last_referer)
-                if last_parsed.netloc and parsed.netloc:
-                    if last_parsed.netloc == parsed.netloc:
+                last_netloc = _netloc(self._last_referer)
+                if last_netloc and netloc:
+                    if last_netloc == netloc:
                         sec_fetch_site = "same-origin"
-                    elif self._is_same_site(last_parsed.netloc, parsed.netloc):
+                    elif self._is_same_site(last_netloc, netloc):
                         sec_fetch_site = "same-site"
                     else:
                         sec_fetch_site = "cross-site"
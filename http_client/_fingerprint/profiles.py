@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import cache
+from types import MappingProxyType
 from typing import Literal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrowserProfile:
     """Browser fingerprint profile for curl_cffi impersonation.
 
@@ -321,31 +324,38 @@ EDGE_119 = BrowserProfile(
 )
 
 
-# Profile registry
-PROFILES: dict[str, BrowserProfile] = {
-    # Chrome
-    "chrome_120": CHROME_120,
-    "chrome_119": CHROME_119,
-    "chrome_118": CHROME_118,
-    # Firefox
-    "firefox_121": FIREFOX_121,
-    "firefox_120": FIREFOX_120,
-    "firefox_117": FIREFOX_117,
-    # Safari
-    "safari_17": SAFARI_17,
-    "safari_16": SAFARI_16,
-    "safari_15": SAFARI_15,
-    # Edge
-    "edge_120": EDGE_120,
-    "edge_119": EDGE_119,
-}
+# Profile registry (read-only; profiles are immutable and shared process-wide)
+PROFILES: Mapping[str, BrowserProfile] = MappingProxyType(
+    {
+        # Chrome
+        "chrome_120": CHROME_120,
+        "chrome_119": CHROME_119,
+        "chrome_118": CHROME_118,
+        # Firefox
+        "firefox_121": FIREFOX_121,
+        "firefox_120": FIREFOX_120,
+        "firefox_117": FIREFOX_117,
+        # Safari
+        "safari_17": SAFARI_17,
+        "safari_16": SAFARI_16,
+        "safari_15": SAFARI_15,
+        # Edge
+        "edge_120": EDGE_120,
+        "edge_119": EDGE_119,
+    }
+)
+
+# Sorted names and error-message listing, computed once (PROFILES is read-only)
+_PROFILE_NAMES: tuple[str, ...] = tuple(sorted(PROFILES))
+_AVAILABLE_PROFILES_MSG = ", ".join(_PROFILE_NAMES)
 
 # Default profile
 DEFAULT_PROFILE = "chrome_120"
 
 
+@cache
 def get_profile(name: str | None = None) -> BrowserProfile:
-    """Get a browser profile by name.
+    """Get a browser profile by name (cached per name).
 
     Args:
         name: Profile name. If None, returns default profile.
@@ -361,12 +371,11 @@ def get_profile(name: str | None = None) -> BrowserProfile:
 
     name = name.lower()
     if name not in PROFILES:
-        available = ", ".join(sorted(PROFILES.keys()))
-        raise ValueError(f"Unknown profile '{name}'. Available: {available}")
+        raise ValueError(f"Unknown profile '{name}'. Available: {_AVAILABLE_PROFILES_MSG}")
 
     return PROFILES[name]
 
 
 def list_profiles() -> list[str]:
     """Get list of available profile names."""
-    return sorted(PROFILES.keys())
+    return list(_PROFILE_NAMES)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
+import heapq
+import itertools
 import threading
+import time
 from typing import Any
 
 from .base import ProxyProvider
@@ -41,6 +43,24 @@ class ProxyManager:
         manager.switch_proxy()
     """
 
+    __slots__ = (
+        "_max_failures",
+        "_cooldown_seconds",
+        "_providers",
+        "_pool",
+        "_pool_by_url",
+        "_health",
+        "_recovery_heap",
+        "_recovery_seq",
+        "_current_index",
+        "_current_proxy",
+        "_active_provider",
+        "_filter_country",
+        "_filter_type",
+        "_filter_protocol",
+        "_thread_lock",
+    )
+
     def __init__(
         self,
         max_failures: int = 3,
@@ -58,11 +78,15 @@ class ProxyManager:
         # Provider registry
         self._providers: dict[str, ProxyProvider] = {}
 
-        # Proxy pool (all active proxies)
+        # Proxy pool (all active proxies), plus URL index for health lookups
         self._pool: list[ProxyConfig] = []
+        self._pool_by_url: dict[str, ProxyConfig] = {}
 
-        # Health tracking
+        # Health tracking, plus a min-heap of (cooldown_until, seq, proxy_id)
+        # for proxies on cooldown so recovery checks don't scan the pool
         self._health: dict[str, ProxyHealth] = {}
+        self._recovery_heap: list[tuple[int, int, str]] = []
+        self._recovery_seq = itertools.count()
 
         # Current state
         self._current_index: int = 0
@@ -74,21 +98,9 @@ class ProxyManager:
         self._filter_type: ProxyType | None = None
         self._filter_protocol: ProxyProtocol = ProxyProtocol.HTTP
 
-        # Thread safety (dual-lock pattern from CookieStore)
+        # Thread safety. No critical section awaits, so the async methods
+        # take the same lock (see CookieStore).
         self._thread_lock = threading.Lock()
-        self._async_lock: asyncio.Lock | None = None
-
-    def _get_async_lock(self) -> asyncio.Lock:
-        """Lazily initialize async lock within event loop context."""
-        with self._thread_lock:
-            if self._async_lock is None:
-                try:
-                    self._async_lock = asyncio.Lock()
-                except RuntimeError as e:
-                    raise RuntimeError(
-                        "Cannot create asyncio.Lock outside of async context."
-                    ) from e
-            return self._async_lock
 
     # ========== Provider Management ==========
 
@@ -113,6 +125,8 @@ class ProxyManager:
                 # Clear pool if active provider was removed
                 if self._active_provider == name:
                     self._pool.clear()
+                    self._pool_by_url.clear()
+                    self._recovery_heap.clear()
                     self._current_proxy = None
                     self._active_provider = None
                 return True
@@ -209,6 +223,7 @@ class ProxyManager:
 
         # Set up pool
         self._pool = proxies
+        self._pool_by_url = {proxy.url: proxy for proxy in proxies}
         self._current_index = 0
         self._current_proxy = proxies[0] if proxies else None
         self._active_provider = provider
@@ -218,6 +233,15 @@ class ProxyManager:
             if proxy.identifier not in self._health:
                 self._health[proxy.identifier] = ProxyHealth(proxy_id=proxy.identifier)
 
+        # Track recovery only for the new pool; proxies kept from the old
+        # one may still be on cooldown
+        self._recovery_heap = [
+            (health.cooldown_until, next(self._recovery_seq), health.proxy_id)
+            for proxy in proxies
+            if (health := self._health[proxy.identifier]).cooldown_until is not None
+        ]
+        heapq.heapify(self._recovery_heap)
+
     async def set_proxy_async(
         self,
         provider: str,
@@ -228,17 +252,14 @@ class ProxyManager:
         **kwargs: Any,
     ) -> None:
         """Set active proxy from provider (async version)."""
-        async_lock = self._get_async_lock()
-        async with async_lock:
-            with self._thread_lock:
-                self._set_proxy_unlocked(
-                    provider, proxy_type, country, protocol, count, **kwargs
-                )
+        self.set_proxy(provider, proxy_type, country, protocol, count, **kwargs)
 
     def reset_proxy(self) -> None:
         """Remove proxy configuration (disable proxy)."""
         with self._thread_lock:
             self._pool.clear()
+            self._pool_by_url.clear()
+            self._recovery_heap.clear()
             self._current_proxy = None
             self._current_index = 0
             self._active_provider = None
@@ -247,15 +268,7 @@ class ProxyManager:
 
     async def reset_proxy_async(self) -> None:
         """Remove proxy configuration (async version)."""
-        async_lock = self._get_async_lock()
-        async with async_lock:
-            with self._thread_lock:
-                self._pool.clear()
-                self._current_proxy = None
-                self._current_index = 0
-                self._active_provider = None
-                self._filter_country = None
-                self._filter_type = None
+        self.reset_proxy()
 
     def switch_proxy(self) -> ProxyConfig | None:
         """Rotate to next healthy proxy in pool.
@@ -276,49 +289,102 @@ class ProxyManager:
         if not self._pool:
             return None
 
-        # Check cooldowns and find next healthy proxy
-        healthy = self._get_healthy_proxies_unlocked()
-
-        if not healthy:
-            raise NoHealthyProxiesError()
+        self._check_recovery_unlocked()
 
-        # Find next proxy after current index
+        # Walk forward from current index, checking health per candidate
+        # instead of building a healthy list first
         pool_size = len(self._pool)
-        start_index = (self._current_index + 1) % pool_size
+        start_index = self._current_index + 1
 
         for i in range(pool_size):
             idx = (start_index + i) % pool_size
             proxy = self._pool[idx]
-            if proxy in healthy:
-                self._current_index = idx
-                self._current_proxy = proxy
-                return proxy
+            health = self._health.get(proxy.identifier)
+            if health and not health.is_healthy and not health.check_cooldown():
+                continue
+            self._current_index = idx
+            self._current_proxy = proxy
+            return proxy
 
-        # Should not reach here if healthy list is not empty
         raise NoHealthyProxiesError()
 
     async def switch_proxy_async(self) -> ProxyConfig | None:
         """Rotate to next healthy proxy (async version)."""
-        async_lock = self._get_async_lock()
-        async with async_lock:
-            with self._thread_lock:
-                return self._switch_proxy_unlocked()
+        return self.switch_proxy()
+
+    def next_proxy_url(self) -> str | None:
+        """Advance round-robin rotation and return the next proxy URL.
+
+        Variant of switch_proxy() for per-request rotation. The candidate is
+        picked without the lock; the lock is only taken to publish it, and
+        only if the pool is unchanged. If set_proxy()/reset_proxy() replaced
+        the pool meanwhile, rotation falls back to switch_proxy() so a proxy
+        from the discarded pool is never made current. Proxies on active
+        cooldown are skipped.
+
+        Returns:
+            Next proxy URL, or None if no proxies in pool
+
+        Raises:
+            NoHealthyProxiesError: If no healthy proxies available
+        """
+        pool = self._pool
+        pool_size = len(pool)
+        if not pool_size:
+            return None
+
+        start_index = self._current_index + 1
+        now = time.monotonic_ns()
+        try:
+            for i in range(pool_size):
+                idx = (start_index + i) % pool_size
+                proxy = pool[idx]
+                health = self._health.get(proxy.identifier)
+                if health is None or health.is_available(now):
+                    break
+            else:
+                raise NoHealthyProxiesError()
+        except IndexError:
+            # Pool was cleared concurrently
+            return None
+
+        with self._thread_lock:
+            # reset_proxy() clears the pool in place, set_proxy() replaces it
+            if self._pool is pool and len(pool) == pool_size:
+                self._current_index = idx
+                self._current_proxy = proxy
+                return proxy.url
+            switched = self._switch_proxy_unlocked()
+            return switched.url if switched else None
 
     def _get_healthy_proxies_unlocked(self) -> list[ProxyConfig]:
         """Get list of healthy proxies (must be called under lock)."""
+        self._check_recovery_unlocked()
         healthy = []
         for proxy in self._pool:
             health = self._health.get(proxy.identifier)
-            if health:
-                # Check if cooldown expired
-                health.check_cooldown()
-                if health.is_healthy:
-                    healthy.append(proxy)
-            else:
-                # No health record = healthy
+            # No health record = healthy
+            if health is None or health.is_healthy or health.check_cooldown():
                 healthy.append(proxy)
         return healthy
 
+    def _check_recovery_unlocked(self) -> None:
+        """Re-enable proxies whose cooldown expired (must be called under lock).
+
+        Only pops heap entries that are due, so the common case (nothing
+        recovering) is a single comparison. Entries made stale by a later
+        failure or a success are discarded. Cooldowns started outside the
+        manager (ProxyHealth.record_failure() on a get_health() result) are
+        not in the heap; callers check those per unhealthy proxy instead.
+        """
+        heap = self._recovery_heap
+        now = time.monotonic_ns()
+        while heap and heap[0][0] < now:
+            cooldown_until, _, proxy_id = heapq.heappop(heap)
+            health = self._health.get(proxy_id)
+            if health and health.cooldown_until == cooldown_until:
+                health.check_cooldown()
+
     # ========== Proxy Access ==========
 
     def get_current_proxy(self) -> str | None:
@@ -327,23 +393,27 @@ class ProxyManager:
         Returns:
             Proxy URL string or None if no proxy set
         """
-        with self._thread_lock:
-            return self._current_proxy.url if self._current_proxy else None
+        # Lock-free: one read of the current (immutable) ProxyConfig
+        proxy = self._current_proxy
+        return proxy.url if proxy else None
 
     async def get_current_proxy_async(self) -> str | None:
         """Get current proxy URL (async version)."""
-        async_lock = self._get_async_lock()
-        async with async_lock:
-            with self._thread_lock:
-                return self._current_proxy.url if self._current_proxy else None
+        return self.get_current_proxy()
 
     def get_current_config(self) -> ProxyConfig | None:
         """Get current proxy configuration."""
-        with self._thread_lock:
-            return self._current_proxy
+        return self._current_proxy
 
     # ========== Health Tracking ==========
 
+    def _get_health_unlocked(self, proxy_url: str) -> ProxyHealth | None:
+        """Get health record for a pool proxy URL (must be called under lock)."""
+        proxy = self._pool_by_url.get(proxy_url)
+        if proxy is None:
+            return None
+        return self._health.get(proxy.identifier)
+
     def record_success(self, proxy_url: str | None, response_time: float) -> None:
         """Record successful request through proxy.
 
@@ -355,30 +425,15 @@ class ProxyManager:
             return
 
         with self._thread_lock:
-            # Find proxy by URL
-            for proxy in self._pool:
-                if proxy.url == proxy_url:
-                    health = self._health.get(proxy.identifier)
-                    if health:
-                        health.record_success(response_time)
-                    break
+            health = self._get_health_unlocked(proxy_url)
+            if health:
+                health.record_success(response_time)
 
     async def record_success_async(
         self, proxy_url: str | None, response_time: float
     ) -> None:
         """Record successful request (async version)."""
-        if not proxy_url:
-            return
-
-        async_lock = self._get_async_lock()
-        async with async_lock:
-            with self._thread_lock:
-                for proxy in self._pool:
-                    if proxy.url == proxy_url:
-                        health = self._health.get(proxy.identifier)
-                        if health:
-                            health.record_success(response_time)
-                        break
+        self.record_success(proxy_url, response_time)
 
     def record_failure(self, proxy_url: str | None, error: str) -> None:
         """Record failed request through proxy.
@@ -391,43 +446,28 @@ class ProxyManager:
             return
 
         with self._thread_lock:
-            for proxy in self._pool:
-                if proxy.url == proxy_url:
-                    health = self._health.get(proxy.identifier)
-                    if health:
-                        health.record_failure(
-                            error,
-                            max_failures=self._max_failures,
-                            cooldown_seconds=self._cooldown_seconds,
-                        )
-                    break
+            health = self._get_health_unlocked(proxy_url)
+            if health:
+                previous_until = health.cooldown_until
+                health.record_failure(
+                    error,
+                    max_failures=self._max_failures,
+                    cooldown_seconds=self._cooldown_seconds,
+                )
+                if health.cooldown_until is not None and health.cooldown_until != previous_until:
+                    heapq.heappush(
+                        self._recovery_heap,
+                        (health.cooldown_until, next(self._recovery_seq), health.proxy_id),
+                    )
 
     async def record_failure_async(self, proxy_url: str | None, error: str) -> None:
         """Record failed request (async version)."""
-        if not proxy_url:
-            return
-
-        async_lock = self._get_async_lock()
-        async with async_lock:
-            with self._thread_lock:
-                for proxy in self._pool:
-                    if proxy.url == proxy_url:
-                        health = self._health.get(proxy.identifier)
-                        if health:
-                            health.record_failure(
-                                error,
-                                max_failures=self._max_failures,
-                                cooldown_seconds=self._cooldown_seconds,
-                            )
-                        break
+        self.record_failure(proxy_url, error)
 
     def get_health(self, proxy_url: str) -> ProxyHealth | None:
         """Get health info for a proxy."""
         with self._thread_lock:
-            for proxy in self._pool:
-                if proxy.url == proxy_url:
-                    return self._health.get(proxy.identifier)
-            return None
+            return self._get_health_unlocked(proxy_url)
 
     # ========== Statistics ==========
 
@@ -461,20 +501,20 @@ class ProxyManager:
 
     # ========== Pool Info ==========
 
+    # Single attribute reads are atomic under the GIL, so these snapshot
+    # accessors skip the lock; has_proxy is checked on every request.
+
     @property
     def pool_size(self) -> int:
-        """Number of proxies in pool."""
-        with self._thread_lock:
-            return len(self._pool)
+        """Number of proxies in pool (lock-free snapshot)."""
+        return len(self._pool)
 
     @property
     def has_proxy(self) -> bool:
-        """Check if a proxy is currently set."""
-        with self._thread_lock:
-            return self._current_proxy is not None
+        """Check if a proxy is currently set (lock-free snapshot)."""
+        return self._current_proxy is not None
 
     @property
     def active_provider_name(self) -> str | None:
-        """Name of currently active provider."""
-        with self._thread_lock:
-            return self._active_provider
+        """Name of currently active provider (lock-free snapshot)."""
+        return self._active_provider
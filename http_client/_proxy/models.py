@@ -5,7 +5,7 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 
 class ProxyProtocol(str, Enum):
@@ -26,7 +26,12 @@ class ProxyType(str, Enum):
     ISP = "isp"
 
 
-@dataclass
+# Value -> member lookups for lenient parsing (no ValueError round trip)
+_PROTOCOLS_BY_VALUE: dict[str, ProxyProtocol] = {p.value: p for p in ProxyProtocol}
+_PROXY_TYPES_BY_VALUE: dict[str, ProxyType] = {t.value: t for t in ProxyType}
+
+
+@dataclass(frozen=True, slots=True)
 class ProxyConfig:
     """Configuration for a single proxy.
 
@@ -53,29 +58,30 @@ class ProxyConfig:
     password: str | None = None
     weight: int = 1
     tags: set[str] = field(default_factory=set)
+    _identifier: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Parse URL if host/port not provided."""
+        """Parse URL if host/port not provided and cache the identifier."""
         if not self.host and self.url:
             self._parse_url()
+        object.__setattr__(self, "_identifier", f"{self.host}:{self.port}")
 
     def _parse_url(self) -> None:
         """Parse proxy URL into components."""
-        parsed = urlparse(self.url)
-        self.host = parsed.hostname or ""
-        self.port = parsed.port or 0
-        self.username = parsed.username
-        self.password = parsed.password
-        if parsed.scheme:
-            try:
-                self.protocol = ProxyProtocol(parsed.scheme.lower())
-            except ValueError:
-                pass
+        # Frozen dataclass: fields are filled in via object.__setattr__
+        parsed = urlsplit(self.url)
+        object.__setattr__(self, "host", parsed.hostname or "")
+        object.__setattr__(self, "port", parsed.port or 0)
+        object.__setattr__(self, "username", parsed.username)
+        object.__setattr__(self, "password", parsed.password)
+        protocol = _PROTOCOLS_BY_VALUE.get(parsed.scheme.lower())
+        if protocol is not None:
+            object.__setattr__(self, "protocol", protocol)
 
     @property
     def identifier(self) -> str:
-        """Unique identifier for this proxy."""
-        return f"{self.host}:{self.port}"
+        """Unique identifier for this proxy (computed once at construction)."""
+        return self._identifier
 
     def __hash__(self) -> int:
         return hash(self.identifier)
@@ -100,7 +106,7 @@ class ProxyHealth:
         last_error: Last error message
         avg_response_time: Average response time in seconds
         is_healthy: Whether proxy is considered healthy
-        cooldown_until: Timestamp until proxy is on cooldown
+        cooldown_until: time.monotonic_ns() deadline of the current cooldown
     """
 
     proxy_id: str
@@ -112,7 +118,7 @@ class ProxyHealth:
     last_error: str | None = None
     avg_response_time: float = 0.0
     is_healthy: bool = True
-    cooldown_until: float | None = None
+    cooldown_until: int | None = None
     _response_times: list[float] = field(default_factory=list)
 
     def record_success(self, response_time: float) -> None:
@@ -145,7 +151,7 @@ class ProxyHealth:
         # Mark unhealthy and set cooldown after max failures
         if self.consecutive_failures >= max_failures:
             self.is_healthy = False
-            self.cooldown_until = time.time() + cooldown_seconds
+            self.cooldown_until = time.monotonic_ns() + int(cooldown_seconds * 1e9)
 
     def check_cooldown(self) -> bool:
         """Check if cooldown has expired and reset if so.
@@ -153,13 +159,28 @@ class ProxyHealth:
         Returns:
             True if cooldown expired and proxy was reset to healthy
         """
-        if self.cooldown_until and time.time() > self.cooldown_until:
+        if self.cooldown_until and time.monotonic_ns() > self.cooldown_until:
             self.cooldown_until = None
             self.is_healthy = True
             self.consecutive_failures = 0
             return True
         return False
 
+    def is_available(self, now: int | None = None) -> bool:
+        """Check if proxy can be used without mutating health state.
+
+        Args:
+            now: Current time.monotonic_ns() (defaults to reading it)
+
+        Returns:
+            True if healthy or cooldown has expired
+        """
+        if self.is_healthy:
+            return True
+        if self.cooldown_until is None:
+            return False
+        return (now if now is not None else time.monotonic_ns()) > self.cooldown_until
+
     @property
     def success_rate(self) -> float:
         """Calculate success rate."""
@@ -8,7 +8,13 @@ from typing import Any
 
 from ..base import ProxyProvider
 from ..exceptions import ProxyConfigurationError
-from ..models import ProxyConfig, ProxyProtocol, ProxyType
+from ..models import (
+    _PROTOCOLS_BY_VALUE,
+    _PROXY_TYPES_BY_VALUE,
+    ProxyConfig,
+    ProxyProtocol,
+    ProxyType,
+)
 
 
 class GenericProvider(ProxyProvider):
@@ -84,17 +90,11 @@ class GenericProvider(ProxyProvider):
 
         protocol = ProxyProtocol.HTTP
         if proto := data.get("protocol"):
-            try:
-                protocol = ProxyProtocol(proto.lower())
-            except ValueError:
-                pass
+            protocol = _PROTOCOLS_BY_VALUE.get(proto.lower(), protocol)
 
         proxy_type = None
         if ptype := data.get("proxy_type"):
-            try:
-                proxy_type = ProxyType(ptype.lower())
-            except ValueError:
-                pass
+            proxy_type = _PROXY_TYPES_BY_VALUE.get(ptype.lower())
 
         return ProxyConfig(
             url=url,
@@ -2,14 +2,84 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
+import threading
+import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Callable, Literal
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+)
 
 from ._backends import CURL_AVAILABLE, CurlBackend, HttpxBackend
 from ._cookies import CookieStore
 from ._debug import DebugInfo, DebugOutput
 from ._proxy import GenericProvider, ProxyManager, ProxyProvider
-from .models import Response
+from .models import (
+    ORJSON_AVAILABLE,
+    BatchResult,
+    MaxRetriesExceeded,
+    Response,
+    TransportError,
+    json_dumps,
+    json_loads,
+)
+
+# Interned backend names so dispatch can compare by identity
+_HTTPX = sys.intern("httpx")
+_CURL = sys.intern("curl")
+
+# Shared by every client using the default retry codes/methods
+_DEFAULT_RETRY_CODES = frozenset({429, 500, 502, 503, 504})
+# Idempotent methods only: retrying POST/PATCH could repeat side effects
+_DEFAULT_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Guards first-time creation of a client's lazily-built members (backends,
+# CookieStore, ProxyManager); once built they are read without the lock
+_lazy_init_lock = threading.Lock()
+
+
+def _encode_json_body(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Return backend kwargs with a json= body pre-encoded by orjson.
+
+    The backends would otherwise encode it with the stdlib json module.
+    kwargs is not modified; it is returned as-is when orjson is not
+    installed or cannot encode the body, so the backend handles it.
+
+    orjson output differs from the stdlib for some bodies: NaN/Infinity
+    are sent as null, and datetime, UUID and dataclass values are encoded
+    instead of raising TypeError.
+    """
+    body = kwargs.get("json")
+    if body is None or kwargs.get("data") is not None or not ORJSON_AVAILABLE:
+        return kwargs
+    try:
+        encoded = json_dumps(body)
+    except TypeError:
+        return kwargs
+    headers = kwargs.get("headers") or {}
+    if not any(name.lower() == "content-type" for name in headers):
+        headers = {**headers, "Content-Type": "application/json"}
+    return {**kwargs, "data": encoded, "json": None, "headers": headers}
+
+
+def _restore_json_body(response: Response, kwargs: dict[str, Any]) -> None:
+    """Record the caller's json= body on response.request.
+
+    Undoes _encode_json_body() on the recorded Request, so request.json
+    and request.data read the same whether or not orjson is installed.
+    """
+    if response.request is not None:
+        response.request.json = kwargs.get("json")
+        response.request.data = kwargs.get("data")
 
 
 class HTTPClient:
@@ -43,6 +113,31 @@ class HTTPClient:
             response = await client.get_async("https://example.com")
     """
 
+    __slots__ = (
+        "_default_backend",
+        "_timeout",
+        "_default_headers",
+        "_verify_ssl",
+        "_proxy",
+        "_follow_redirects",
+        "_profile",
+        "_http_version",
+        "_curl_options",
+        "_max_retries",
+        "_retry_codes",
+        "_retry_methods",
+        "_retry_delays",
+        "_persist_cookies",
+        "_cookie_store",
+        "_httpx_backend",
+        "_curl_backend",
+        "_open_backends",
+        "_last_response",
+        "_closed",
+        "_proxy_manager",
+        "_debug",
+    )
+
     def __init__(
         self,
         default_backend: Literal["httpx", "curl"] = "httpx",
@@ -56,6 +151,11 @@ class HTTPClient:
         http_version: Literal["1.1", "2"] | None = None,
         verbose: bool = False,
         debug_callback: Callable[[DebugInfo], None] | None = None,
+        curl_options: dict[Any, Any] | None = None,
+        max_retries: int = 0,
+        retry_codes: Iterable[int] = _DEFAULT_RETRY_CODES,
+        retry_backoff: float = 0.5,
+        retry_methods: Iterable[str] = _DEFAULT_RETRY_METHODS,
     ):
         """Initialize HTTPClient.
 
@@ -71,8 +171,21 @@ class HTTPClient:
             http_version: HTTP version to use ("1.1" or "2"). None for auto.
             verbose: Enable verbose debug output to stderr.
             debug_callback: Optional callback for programmatic debug capture.
+            curl_options: Extra CurlOpt options for the curl backend sessions.
+            max_retries: Retries on transport errors or retry_codes (0 disables).
+                Only requests using one of retry_methods are retried.
+            retry_codes: Status codes that trigger a retry.
+            retry_backoff: Base delay in seconds, doubled after each retry.
+            retry_methods: HTTP methods that may be retried. Defaults to the
+                idempotent GET, HEAD, OPTIONS, PUT and DELETE.
+
+        Raises:
+            ValueError: If max_retries is negative.
         """
-        self._default_backend = default_backend
+        if max_retries < 0:
+            raise ValueError(f"max_retries must be >= 0, got {max_retries}")
+
+        self._default_backend = sys.intern(default_backend)
         self._timeout = timeout
         self._default_headers = dict(headers) if headers else {}
         self._verify_ssl = verify_ssl
@@ -80,15 +193,28 @@ class HTTPClient:
         self._follow_redirects = follow_redirects
         self._profile = profile
         self._http_version = http_version
+        self._curl_options = dict(curl_options) if curl_options else None
+
+        # Retry settings
+        self._max_retries = max_retries
+        # frozenset() returns a frozenset argument as-is, so the default is shared
+        self._retry_codes = frozenset(retry_codes)
+        self._retry_methods = (
+            retry_methods
+            if retry_methods is _DEFAULT_RETRY_METHODS
+            else frozenset(method.upper() for method in retry_methods)
+        )
+        # Backoff delay before retry N, computed once instead of per attempt
+        self._retry_delays = tuple(retry_backoff * (2**i) for i in range(max_retries))
 
-        # Cookie store (shared across backends)
+        # Cookie store (shared across backends, created on first cookie)
+        self._persist_cookies = persist_cookies
         self._cookie_store: CookieStore | None = None
-        if persist_cookies:
-            self._cookie_store = CookieStore()
 
         # Lazy-initialized backends
         self._httpx_backend: HttpxBackend | None = None
         self._curl_backend: CurlBackend | None = None
+        self._open_backends: list[HttpxBackend | CurlBackend] = []
 
         # State tracking
         self._last_response: Response | None = None
@@ -103,13 +229,16 @@ class HTTPClient:
     def _get_httpx_backend(self) -> HttpxBackend:
         """Get or create httpx backend."""
         if self._httpx_backend is None:
-            self._httpx_backend = HttpxBackend(
-                timeout=self._timeout,
-                verify_ssl=self._verify_ssl,
-                follow_redirects=self._follow_redirects,
-                profile=self._profile,
-                http_version=self._http_version,
-            )
+            with _lazy_init_lock:
+                if self._httpx_backend is None:
+                    self._httpx_backend = HttpxBackend(
+                        timeout=self._timeout,
+                        verify_ssl=self._verify_ssl,
+                        follow_redirects=self._follow_redirects,
+                        profile=self._profile,
+                        http_version=self._http_version,
+                    )
+                    self._open_backends.append(self._httpx_backend)
         return self._httpx_backend
 
     def _get_curl_backend(self) -> CurlBackend:
@@ -120,29 +249,62 @@ class HTTPClient:
                     "curl_cffi is required for curl backend. "
                     "Install with: pip install curl_cffi"
                 )
-            self._curl_backend = CurlBackend(
-                profile=self._profile,
-                timeout=self._timeout,
-                verify_ssl=self._verify_ssl,
-                follow_redirects=self._follow_redirects,
-                http_version=self._http_version,
-            )
+            with _lazy_init_lock:
+                if self._curl_backend is None:
+                    self._curl_backend = CurlBackend(
+                        profile=self._profile,
+                        timeout=self._timeout,
+                        verify_ssl=self._verify_ssl,
+                        follow_redirects=self._follow_redirects,
+                        http_version=self._http_version,
+                        curl_options=self._curl_options,
+                    )
+                    self._open_backends.append(self._curl_backend)
         return self._curl_backend
 
+    # Backend name -> lazy getter; unknown names fall back to httpx
+    _BACKEND_GETTERS: dict[str, Callable[[HTTPClient], HttpxBackend | CurlBackend]] = {
+        _HTTPX: _get_httpx_backend,
+        _CURL: _get_curl_backend,
+    }
+
+    def _get_backend(self, backend_name: str) -> HttpxBackend | CurlBackend:
+        """Get or create the backend registered under backend_name."""
+        getter = self._BACKEND_GETTERS.get(backend_name, HTTPClient._get_httpx_backend)
+        return getter(self)
+
     def _get_proxy_manager(self) -> ProxyManager:
         """Get or create proxy manager."""
         if self._proxy_manager is None:
-            self._proxy_manager = ProxyManager()
+            with _lazy_init_lock:
+                if self._proxy_manager is None:
+                    self._proxy_manager = ProxyManager()
         return self._proxy_manager
 
     def _resolve_backend(self, backend: str | None) -> str:
-        """Resolve which backend to use."""
-        return backend or self._default_backend
+        """Resolve which backend to use (interned for identity compares)."""
+        return sys.intern(backend) if backend else self._default_backend
+
+    def _select_proxy(self, rotate: bool) -> str | None:
+        """Get proxy for a request, optionally rotating the pool first."""
+        if rotate and self._proxy_manager:
+            url = self._proxy_manager.next_proxy_url()
+            if url:
+                return url
+        return self.get_current_proxy()
+
+    def _get_cookie_store(self) -> CookieStore:
+        """Get or create cookie store (lazy initialization)."""
+        if self._cookie_store is None:
+            with _lazy_init_lock:
+                if self._cookie_store is None:
+                    self._cookie_store = CookieStore()
+        return self._cookie_store
 
     def _prepare_cookies(self, url: str, cookies: dict | None) -> dict[str, str]:
         """Merge request cookies with stored cookies."""
         result = {}
-        if self._cookie_store:
+        if self._cookie_store is not None:
             result.update(self._cookie_store.get_for_url(url))
         if cookies:
             result.update(cookies)
@@ -153,7 +315,7 @@ class HTTPClient:
     ) -> dict[str, str]:
         """Merge request cookies with stored cookies (async)."""
         result = {}
-        if self._cookie_store:
+        if self._cookie_store is not None:
             result.update(await self._cookie_store.get_for_url_async(url))
         if cookies:
             result.update(cookies)
@@ -161,18 +323,98 @@ class HTTPClient:
 
     def _store_cookies(self, url: str, response_cookies: dict[str, str]) -> None:
         """Store cookies from response."""
-        if self._cookie_store is not None and response_cookies:
-            self._cookie_store.update_from_response(url, response_cookies)
+        if self._persist_cookies and response_cookies:
+            self._get_cookie_store().update_from_response(url, response_cookies)
 
     async def _store_cookies_async(
         self, url: str, response_cookies: dict[str, str]
     ) -> None:
         """Store cookies from response (async)."""
-        if self._cookie_store is not None and response_cookies:
-            await self._cookie_store.update_from_response_async(url, response_cookies)
+        if self._persist_cookies and response_cookies:
+            await self._get_cookie_store().update_from_response_async(
+                url, response_cookies
+            )
+
+    def _retries_for(self, method: str) -> int:
+        """Get the retry limit for a request method (0 if not retryable)."""
+        if self._max_retries and method.upper() not in self._retry_methods:
+            return 0
+        return self._max_retries
+
+    def _send_sync(
+        self, backend_impl: HttpxBackend | CurlBackend, url: str, **kwargs: Any
+    ) -> Response:
+        """Send request through backend, retrying per retry settings.
+
+        Raises:
+            MaxRetriesExceeded: If the method is retryable, retries are
+                enabled and every attempt failed with a transport error.
+        """
+        backend_kwargs = _encode_json_body(kwargs)
+        max_retries = self._retries_for(kwargs["method"])
+        attempt = 0
+        while True:
+            try:
+                response = backend_impl.request_sync(url=url, **backend_kwargs)
+            except TransportError as e:
+                if attempt >= max_retries:
+                    if max_retries:
+                        raise MaxRetriesExceeded(url, attempt, e) from e
+                    raise
+            else:
+                if (
+                    attempt >= max_retries
+                    or response.status_code not in self._retry_codes
+                ):
+                    if backend_kwargs is not kwargs:
+                        _restore_json_body(response, kwargs)
+                    return response
+            time.sleep(self._retry_delays[attempt])
+            attempt += 1
+
+    async def _send_async(
+        self, backend_impl: HttpxBackend | CurlBackend, url: str, **kwargs: Any
+    ) -> Response:
+        """Send request through backend, retrying per retry settings (async).
+
+        Backoff uses asyncio.sleep so other tasks keep running while waiting.
+
+        Raises:
+            MaxRetriesExceeded: If the method is retryable, retries are
+                enabled and every attempt failed with a transport error.
+        """
+        backend_kwargs = _encode_json_body(kwargs)
+        max_retries = self._retries_for(kwargs["method"])
+        attempt = 0
+        while True:
+            try:
+                response = await backend_impl.request_async(url=url, **backend_kwargs)
+            except TransportError as e:
+                if attempt >= max_retries:
+                    if max_retries:
+                        raise MaxRetriesExceeded(url, attempt, e) from e
+                    raise
+            else:
+                if (
+                    attempt >= max_retries
+                    or response.status_code not in self._retry_codes
+                ):
+                    if backend_kwargs is not kwargs:
+                        _restore_json_body(response, kwargs)
+                    return response
+            await asyncio.sleep(self._retry_delays[attempt])
+            attempt += 1
+
+    def _set_last_response(self, response: Response) -> None:
+        """Record last response for the get_* helpers."""
+        self._last_response = response
 
     def _merge_headers(self, headers: dict | None) -> dict[str, str]:
-        """Merge request headers with defaults."""
+        """Merge request headers with defaults.
+
+        Always returns a new dict: it travels on to the backend and into
+        Response.request, so sharing it would let callers alter defaults.
+        """
         result = dict(self._default_headers)
         if headers:
             result.update(headers)
@@ -194,6 +436,7 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
+        rotate_proxy: bool = False,
     ) -> Response:
         """Make an HTTP request.
 
@@ -209,6 +452,7 @@ class HTTPClient:
             proxy: Request-specific proxy.
             backend: Backend to use ("httpx" or "curl").
             stealth: Apply browser fingerprinting (curl backend only).
+            rotate_proxy: Advance to the next proxy in the pool for this request.
 
         Returns:
             Response object.
@@ -219,8 +463,8 @@ class HTTPClient:
         backend_name = self._resolve_backend(backend)
         final_headers = self._merge_headers(headers)
         final_cookies = self._prepare_cookies(url, cookies)
-        final_timeout = timeout or self._timeout
-        final_proxy = proxy or self.get_current_proxy()
+        final_timeout = timeout if timeout is not None else self._timeout
+        final_proxy = proxy if proxy is not None else self._select_proxy(rotate_proxy)
 
         # Prepare debug info if verbose mode is enabled
         debug_info: DebugInfo | None = None
@@ -240,37 +484,23 @@ class HTTPClient:
             )
 
         try:
-            if backend_name == "curl":
-                backend_impl = self._get_curl_backend()
-                response = backend_impl.request_sync(
-                    method=method,
-                    url=url,
-                    headers=final_headers,
-                    params=params,
-                    data=data,
-                    json=json,
-                    cookies=final_cookies or None,
-                    timeout=final_timeout,
-                    proxy=final_proxy,
-                    stealth=stealth,
-                )
-                # Capture impersonate info for curl backend
-                if debug_info:
-                    debug_info.impersonate = backend_impl._impersonate
-            else:
-                backend_impl = self._get_httpx_backend()
-                response = backend_impl.request_sync(
-                    method=method,
-                    url=url,
-                    headers=final_headers,
-                    params=params,
-                    data=data,
-                    json=json,
-                    cookies=final_cookies or None,
-                    timeout=final_timeout,
-                    proxy=final_proxy,
-                    stealth=stealth,
-                )
+            backend_impl = self._get_backend(backend_name)
+            response = self._send_sync(
+                backend_impl,
+                url,
+                method=method,
+                headers=final_headers,
+                params=params,
+                data=data,
+                json=json,
+                cookies=final_cookies or None,
+                timeout=final_timeout,
+                proxy=final_proxy,
+                stealth=stealth,
+            )
+            # Capture impersonate info for curl backend
+            if debug_info and backend_name is _CURL:
+                debug_info.impersonate = getattr(backend_impl, "_impersonate", None)
 
             # Record success for proxy health tracking
             if self._proxy_manager and self._proxy_manager.has_proxy:
@@ -309,7 +539,7 @@ class HTTPClient:
                 self._debug.log_request(debug_info)
 
         self._store_cookies(url, response.cookies)
-        self._last_response = response
+        self._set_last_response(response)
         return response
 
     def get(
@@ -323,6 +553,7 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
+        rotate_proxy: bool = False,
     ) -> Response:
         """Make a GET request."""
         return self.request(
@@ -335,6 +566,7 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
     def post(
@@ -350,6 +582,7 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
+        rotate_proxy: bool = False,
     ) -> Response:
         """Make a POST request."""
         return self.request(
@@ -364,6 +597,7 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
     def put(
@@ -379,6 +613,7 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
+        rotate_proxy: bool = False,
     ) -> Response:
         """Make a PUT request."""
         return self.request(
@@ -393,6 +628,7 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
     def delete(
@@ -406,6 +642,7 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
+        rotate_proxy: bool = False,
     ) -> Response:
         """Make a DELETE request."""
         return self.request(
@@ -418,6 +655,7 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
     def patch(
@@ -433,6 +671,7 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
+        rotate_proxy: bool = False,
     ) -> Response:
         """Make a PATCH request."""
         return self.request(
@@ -447,6 +686,7 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
     def head(
@@ -460,6 +700,7 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
+        rotate_proxy: bool = False,
     ) -> Response:
         """Make a HEAD request."""
         return self.request(
@@ -472,6 +713,7 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
     def options(
@@ -485,6 +727,7 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
+        rotate_proxy: bool = False,
     ) -> Response:
         """Make an OPTIONS request."""
         return self.request(
@@ -497,8 +740,139 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
+    def get_json(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+        cookies: dict[str, str] | None = None,
+        timeout: float | None = None,
+        proxy: str | None = None,
+        backend: Literal["httpx", "curl"] | None = None,
+        stealth: bool = False,
+        rotate_proxy: bool = False,
+    ) -> Any:
+        """Make a GET request and decode the body as JSON.
+
+        Decodes the raw bytes directly (with orjson when installed),
+        equivalent to client.get(url).json().
+
+        Returns:
+            Decoded JSON value.
+        """
+        response = self.request(
+            "GET",
+            url,
+            headers=headers,
+            params=params,
+            cookies=cookies,
+            timeout=timeout,
+            proxy=proxy,
+            backend=backend,
+            stealth=stealth,
+            rotate_proxy=rotate_proxy,
+        )
+        return json_loads(response.content)
+
+    def stream(
+        self,
+        url: str,
+        *,
+        method: str = "GET",
+        chunk_size: int = 65536,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+        data: Any = None,
+        json: Any = None,
+        cookies: dict[str, str] | None = None,
+        timeout: float | None = None,
+        proxy: str | None = None,
+        backend: Literal["httpx", "curl"] | None = None,
+        stealth: bool = False,
+        rotate_proxy: bool = False,
+    ) -> Iterator[bytes]:
+        """Stream a response body in chunks without buffering it in memory.
+
+        The request is sent when stream() is called, so connection errors
+        are raised here rather than on first iteration. Status, headers and
+        cookies are then available via last_response and get_status_code();
+        last_response.content stays empty. Proxy health is recorded as in
+        request(), including failures while reading the body. Retries and
+        verbose debug output do not apply to streamed requests.
+
+        Args:
+            url: Request URL.
+            method: HTTP method.
+            chunk_size: Maximum size of each yielded chunk in bytes (httpx
+                backend only; curl yields chunks as libcurl delivers them).
+            headers: Request headers (merged with defaults).
+            params: URL query parameters.
+            data: Form data.
+            json: JSON body.
+            cookies: Request cookies (merged with stored cookies).
+            timeout: Request-specific timeout.
+            proxy: Request-specific proxy.
+            backend: Backend to use ("httpx" or "curl").
+            stealth: Apply browser fingerprinting.
+            rotate_proxy: Advance to the next proxy in the pool for this request.
+
+        Returns:
+            Iterator over body chunks as bytes. The connection is released
+            when it is exhausted or closed.
+
+        Example:
+            with open("large.bin", "wb") as f:
+                for chunk in client.stream("https://example.com/large.bin"):
+                    f.write(chunk)
+        """
+        if self._closed:
+            raise RuntimeError("Client is closed")
+
+        backend_impl = self._get_backend(self._resolve_backend(backend))
+        final_proxy = proxy if proxy is not None else self._select_proxy(rotate_proxy)
+
+        started = time.perf_counter()
+        try:
+            response, chunks = backend_impl.stream_sync(
+                method=method,
+                url=url,
+                headers=self._merge_headers(headers),
+                params=params,
+                data=data,
+                json=json,
+                cookies=self._prepare_cookies(url, cookies) or None,
+                timeout=timeout if timeout is not None else self._timeout,
+                proxy=final_proxy,
+                stealth=stealth,
+                chunk_size=chunk_size,
+            )
+        except Exception as e:
+            # Record failure for proxy health tracking
+            if self._proxy_manager and self._proxy_manager.has_proxy:
+                self._proxy_manager.record_failure(final_proxy, str(e))
+            raise
+
+        # Record success for proxy health tracking (time to response headers)
+        if self._proxy_manager and self._proxy_manager.has_proxy:
+            self._proxy_manager.record_success(final_proxy, time.perf_counter() - started)
+
+        self._store_cookies(url, response.cookies)
+        self._set_last_response(response)
+
+        def iter_chunks() -> Iterator[bytes]:
+            try:
+                yield from chunks
+            except Exception as e:
+                if self._proxy_manager and self._proxy_manager.has_proxy:
+                    self._proxy_manager.record_failure(final_proxy, str(e))
+                raise
+
+        return iter_chunks()
+
     # ========== Async HTTP Methods ==========
 
     async def request_async(
@@ -515,6 +889,7 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
+        rotate_proxy: bool = False,
     ) -> Response:
         """Make an async HTTP request.
 
@@ -530,6 +905,7 @@ class HTTPClient:
             proxy: Request-specific proxy.
             backend: Backend to use ("httpx" or "curl").
             stealth: Apply browser fingerprinting (curl backend only).
+            rotate_proxy: Advance to the next proxy in the pool for this request.
 
         Returns:
             Response object.
@@ -540,8 +916,8 @@ class HTTPClient:
         backend_name = self._resolve_backend(backend)
         final_headers = self._merge_headers(headers)
         final_cookies = await self._prepare_cookies_async(url, cookies)
-        final_timeout = timeout or self._timeout
-        final_proxy = proxy or self.get_current_proxy()
+        final_timeout = timeout if timeout is not None else self._timeout
+        final_proxy = proxy if proxy is not None else self._select_proxy(rotate_proxy)
 
         # Prepare debug info if verbose mode is enabled
         debug_info: DebugInfo | None = None
@@ -561,37 +937,23 @@ class HTTPClient:
             )
 
         try:
-            if backend_name == "curl":
-                backend_impl = self._get_curl_backend()
-                response = await backend_impl.request_async(
-                    method=method,
-                    url=url,
-                    headers=final_headers,
-                    params=params,
-                    data=data,
-                    json=json,
-                    cookies=final_cookies or None,
-                    timeout=final_timeout,
-                    proxy=final_proxy,
-                    stealth=stealth,
-                )
-                # Capture impersonate info for curl backend
-                if debug_info:
-                    debug_info.impersonate = backend_impl._impersonate
-            else:
-                backend_impl = self._get_httpx_backend()
-                response = await backend_impl.request_async(
-                    method=method,
-                    url=url,
-                    headers=final_headers,
-                    params=params,
-                    data=data,
-                    json=json,
-                    cookies=final_cookies or None,
-                    timeout=final_timeout,
-                    proxy=final_proxy,
-                    stealth=stealth,
-                )
+            backend_impl = self._get_backend(backend_name)
+            response = await self._send_async(
+                backend_impl,
+                url,
+                method=method,
+                headers=final_headers,
+                params=params,
+                data=data,
+                json=json,
+                cookies=final_cookies or None,
+                timeout=final_timeout,
+                proxy=final_proxy,
+                stealth=stealth,
+            )
+            # Capture impersonate info for curl backend
+            if debug_info and backend_name is _CURL:
+                debug_info.impersonate = getattr(backend_impl, "_impersonate", None)
 
             # Record success for proxy health tracking
             if self._proxy_manager and self._proxy_manager.has_proxy:
@@ -632,10 +994,13 @@ class HTTPClient:
                 self._debug.log_request(debug_info)
 
         await self._store_cookies_async(url, response.cookies)
-        self._last_response = response
+        self._set_last_response(response)
         return response
 
-    async def get_async(
+    # The method wrappers below are plain functions returning request_async()'s
+    # coroutine, so each call allocates one coroutine instead of two.
+
+    def get_async(
         self,
         url: str,
         *,
@@ -646,9 +1011,10 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
-    ) -> Response:
+        rotate_proxy: bool = False,
+    ) -> Coroutine[Any, Any, Response]:
         """Make an async GET request."""
-        return await self.request_async(
+        return self.request_async(
             "GET",
             url,
             headers=headers,
@@ -658,9 +1024,10 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
-    async def post_async(
+    def post_async(
         self,
         url: str,
         *,
@@ -673,9 +1040,10 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
-    ) -> Response:
+        rotate_proxy: bool = False,
+    ) -> Coroutine[Any, Any, Response]:
         """Make an async POST request."""
-        return await self.request_async(
+        return self.request_async(
             "POST",
             url,
             headers=headers,
@@ -687,9 +1055,10 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
-    async def put_async(
+    def put_async(
         self,
         url: str,
         *,
@@ -702,9 +1071,10 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
-    ) -> Response:
+        rotate_proxy: bool = False,
+    ) -> Coroutine[Any, Any, Response]:
         """Make an async PUT request."""
-        return await self.request_async(
+        return self.request_async(
             "PUT",
             url,
             headers=headers,
@@ -716,9 +1086,10 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
-    async def delete_async(
+    def delete_async(
         self,
         url: str,
         *,
@@ -729,9 +1100,10 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
-    ) -> Response:
+        rotate_proxy: bool = False,
+    ) -> Coroutine[Any, Any, Response]:
         """Make an async DELETE request."""
-        return await self.request_async(
+        return self.request_async(
             "DELETE",
             url,
             headers=headers,
@@ -741,9 +1113,10 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
-    async def patch_async(
+    def patch_async(
         self,
         url: str,
         *,
@@ -756,9 +1129,10 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
-    ) -> Response:
+        rotate_proxy: bool = False,
+    ) -> Coroutine[Any, Any, Response]:
         """Make an async PATCH request."""
-        return await self.request_async(
+        return self.request_async(
             "PATCH",
             url,
             headers=headers,
@@ -770,9 +1144,10 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
-    async def head_async(
+    def head_async(
         self,
         url: str,
         *,
@@ -783,9 +1158,10 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
-    ) -> Response:
+        rotate_proxy: bool = False,
+    ) -> Coroutine[Any, Any, Response]:
         """Make an async HEAD request."""
-        return await self.request_async(
+        return self.request_async(
             "HEAD",
             url,
             headers=headers,
@@ -795,9 +1171,10 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
-    async def options_async(
+    def options_async(
         self,
         url: str,
         *,
@@ -808,9 +1185,10 @@ class HTTPClient:
         proxy: str | None = None,
         backend: Literal["httpx", "curl"] | None = None,
         stealth: bool = False,
-    ) -> Response:
+        rotate_proxy: bool = False,
+    ) -> Coroutine[Any, Any, Response]:
         """Make an async OPTIONS request."""
-        return await self.request_async(
+        return self.request_async(
             "OPTIONS",
             url,
             headers=headers,
@@ -820,21 +1198,164 @@ class HTTPClient:
             proxy=proxy,
             backend=backend,
             stealth=stealth,
+            rotate_proxy=rotate_proxy,
         )
 
+    async def get_json_async(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+        cookies: dict[str, str] | None = None,
+        timeout: float | None = None,
+        proxy: str | None = None,
+        backend: Literal["httpx", "curl"] | None = None,
+        stealth: bool = False,
+        rotate_proxy: bool = False,
+    ) -> Any:
+        """Make an async GET request and decode the body as JSON.
+
+        Returns:
+            Decoded JSON value.
+        """
+        response = await self.request_async(
+            "GET",
+            url,
+            headers=headers,
+            params=params,
+            cookies=cookies,
+            timeout=timeout,
+            proxy=proxy,
+            backend=backend,
+            stealth=stealth,
+            rotate_proxy=rotate_proxy,
+        )
+        return json_loads(response.content)
+
+    async def request_many_async(
+        self,
+        specs: list[dict[str, Any]],
+        *,
+        backend: Literal["httpx", "curl"] | None = None,
+        stealth: bool = False,
+        max_concurrency: int | None = None,
+    ) -> BatchResult:
+        """Make many async requests concurrently with shared setup.
+
+        Backend and proxy are resolved once for the whole batch instead of
+        per request, and response cookies are stored in a single pass after
+        all requests finish. Proxy successes and failures are recorded as
+        each request completes, so proxy health ends in the same state as
+        for sequential requests.
+        A failed request does not cancel the others; its exception is
+        reported in the result. Verbose debug output is not emitted for
+        batched requests.
+
+        Args:
+            specs: One dict per request with "url" and optional "method"
+                (default "GET"), "headers", "params", "data", "json",
+                "cookies", "timeout" and "proxy".
+            backend: Backend to use for all requests ("httpx" or "curl").
+            stealth: Apply browser fingerprinting to all requests.
+            max_concurrency: Maximum requests in flight (None for unlimited).
+
+        Returns:
+            BatchResult with responses in spec order and errors by index.
+
+        Example:
+            result = await client.request_many_async(
+                [{"url": u} for u in urls], max_concurrency=50
+            )
+        """
+        if self._closed:
+            raise RuntimeError("Client is closed")
+
+        backend_impl = self._get_backend(self._resolve_backend(backend))
+        default_proxy = self.get_current_proxy()
+        # Proxy health is only tracked while the manager has a pool
+        manager = self._proxy_manager
+        if manager is not None and not manager.has_proxy:
+            manager = None
+
+        async def send(spec: dict[str, Any]) -> Response:
+            url = spec["url"]
+            headers = spec.get("headers")
+            proxy = spec.get("proxy")
+            final_proxy = proxy if proxy is not None else default_proxy
+            timeout = spec.get("timeout")
+            cookies = await self._prepare_cookies_async(url, spec.get("cookies"))
+            try:
+                response = await self._send_async(
+                    backend_impl,
+                    url,
+                    method=spec.get("method", "GET"),
+                    headers=self._merge_headers(headers),
+                    params=spec.get("params"),
+                    data=spec.get("data"),
+                    json=spec.get("json"),
+                    cookies=cookies or None,
+                    timeout=timeout if timeout is not None else self._timeout,
+                    proxy=final_proxy,
+                    stealth=stealth,
+                )
+            except Exception as e:
+                if manager is not None:
+                    await manager.record_failure_async(final_proxy, str(e))
+                raise
+            if manager is not None:
+                await manager.record_success_async(final_proxy, response.elapsed)
+            return response
+
+        runner = send
+        if max_concurrency:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def send_limited(spec: dict[str, Any]) -> Response:
+                async with semaphore:
+                    return await send(spec)
+
+            runner = send_limited
+
+        results = await asyncio.gather(
+            *(runner(spec) for spec in specs), return_exceptions=True
+        )
+
+        responses: list[Response | None] = []
+        errors: dict[int, Exception] = {}
+        last_response: Response | None = None
+        for index, (spec, result) in enumerate(zip(specs, results, strict=True)):
+            if isinstance(result, Exception):
+                responses.append(None)
+                errors[index] = result
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            await self._store_cookies_async(spec["url"], result.cookies)
+            responses.append(result)
+            last_response = result
+
+        if last_response is not None:
+            self._set_last_response(last_response)
+        return BatchResult(responses=responses, errors=errors)
+
     # ========== Helper Methods ==========
 
     def get_status_code(self) -> int | None:
         """Get status code from last response."""
         return self._last_response.status_code if self._last_response else None
 
-    def get_headers(self) -> dict[str, str] | None:
-        """Get headers from last response."""
-        return dict(self._last_response.headers) if self._last_response else None
+    def get_headers(self) -> Mapping[str, str] | None:
+        """Get headers from last response as a read-only view."""
+        if self._last_response is None:
+            return None
+        return MappingProxyType(self._last_response.headers)
 
-    def get_cookies(self) -> dict[str, str] | None:
-        """Get cookies from last response."""
-        return dict(self._last_response.cookies) if self._last_response else None
+    def get_cookies(self) -> Mapping[str, str] | None:
+        """Get cookies from last response as a read-only view."""
+        if self._last_response is None:
+            return None
+        return MappingProxyType(self._last_response.cookies)
 
     def get_current_proxy(self) -> str | None:
         """Get currently configured proxy URL.
@@ -873,13 +1394,13 @@ class HTTPClient:
     @property
     def cookies(self) -> dict[str, dict[str, str]]:
         """Get all stored cookies organized by domain."""
-        if self._cookie_store:
+        if self._cookie_store is not None:
             return self._cookie_store.get_all()
         return {}
 
     def clear_cookies(self, domain: str | None = None) -> None:
         """Clear cookies, optionally for specific domain."""
-        if self._cookie_store:
+        if self._cookie_store is not None:
             if domain:
                 self._cookie_store.clear_domain(domain)
             else:
@@ -1119,21 +1640,22 @@ class HTTPClient:
 
     def close(self) -> None:
         """Close client and release resources."""
-        if not self._closed:
-            if self._httpx_backend:
-                self._httpx_backend.close_sync()
-            if self._curl_backend:
-                self._curl_backend.close_sync()
-            self._closed = True
+        if self._closed:
+            return
+        for backend in self._open_backends:
+            backend.close_sync()
+        self._open_backends.clear()
+        self._closed = True
 
     async def close_async(self) -> None:
-        """Close client asynchronously."""
-        if not self._closed:
-            if self._httpx_backend:
-                await self._httpx_backend.close_async()
-            if self._curl_backend:
-                await self._curl_backend.close_async()
-            self._closed = True
+        """Close client asynchronously (backends are closed concurrently)."""
+        if self._closed:
+            return
+        await asyncio.gather(
+            *(backend.close_async() for backend in self._open_backends)
+        )
+        self._open_backends.clear()
+        self._closed = True
 
     def __enter__(self) -> "HTTPClient":
         return self
@@ -1,11 +1,44 @@
 """Request and Response dataclasses."""
 
+import json as _json
 from dataclasses import dataclass, field, replace
 from typing import Any
 from http.cookies import SimpleCookie
 
+# Optional orjson import for faster JSON encoding/decoding
+# (orjson is only referenced behind ORJSON_AVAILABLE)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+def json_loads(content: bytes | str) -> Any:
+    """Decode JSON, using orjson when installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    catch the stdlib exception either way.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return _json.loads(content)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode JSON to UTF-8 bytes, using orjson when installed.
+
+    Raises:
+        TypeError: If obj is not JSON serializable (orjson.JSONEncodeError
+            subclasses TypeError).
+    """
+    if ORJSON_AVAILABLE:
+        encoded: bytes = orjson.dumps(obj)
+        return encoded
+    return _json.dumps(obj, separators=(",", ":")).encode()
+
+
+@dataclass(slots=True)
 class Request:
     """HTTP request representation.
 
@@ -33,7 +66,10 @@ class Request:
 
     def __post_init__(self) -> None:
         """Normalize method to uppercase."""
-        self.method = self.method.upper()
+        # Verb wrappers pass interned uppercase literals; keep those as-is
+        # instead of allocating an identical string.
+        if not self.method.isupper():
+            self.method = self.method.upper()
 
     def with_cookies(self, cookies: dict[str, str]) -> "Request":
         """Return a copy of this request with updated cookies.
@@ -49,7 +85,7 @@ class Request:
         return replace(self, cookies=cookies)
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     """HTTP response representation.
 
@@ -72,11 +108,16 @@ class Response:
     elapsed: float = 0.0
     request: Request | None = None
     history: list["Response"] = field(default_factory=list)
+    # (content it was decoded from, text); reassigning content invalidates it
+    _text: tuple[bytes, str] | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def text(self) -> str:
-        """Decode content as UTF-8 text."""
-        return self.content.decode("utf-8", errors="replace")
+        """Decode content as UTF-8 text (decoded once per content, then cached)."""
+        cached = self._text
+        if cached is None or cached[0] is not self.content:
+            cached = self._text = (self.content, self.content.decode("utf-8", errors="replace"))
+        return cached[1]
 
     @property
     def ok(self) -> bool:
@@ -85,8 +126,7 @@ class Response:
 
     def json(self) -> Any:
         """Parse content as JSON."""
-        import json as json_module
-        return json_module.loads(self.content)
+        return json_loads(self.content)
 
     def raise_for_status(self) -> None:
         """Raise HTTPError if status code indicates an error."""
@@ -178,7 +218,10 @@ class BatchResult:
         return len(self.errors) == 0
 
     def raise_on_error(self) -> None:
-        """Raise the first error if any requests failed."""
-        if self.errors:
-            first_idx = min(self.errors.keys())
-            raise self.errors[first_idx]
+        """Raise the first error (lowest index) if any requests failed."""
+        if not self.errors:
+            return
+        if len(self.errors) == 1:
+            raise next(iter(self.errors.values()))
+        # Errors may be recorded out of index order, so find the lowest
+        raise self.errors[min(self.errors)]
@@ -1,12 +1,12 @@
 """Shared test fixtures and configuration."""
 
-import asyncio
-from typing import AsyncGenerator, Generator
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from http_client import HTTPClient, Request, Response
+from http_client import client as client_module
+from http_client._backends import CurlBackend, HttpxBackend
 from http_client._cookies import CookieStore
 
 
@@ -29,8 +29,9 @@ def populated_cookie_store() -> CookieStore:
 
 
 # ============== Request/Response Fixtures ==============
+# Read-only values: session-scoped (built once), tests must not mutate them
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_request() -> Request:
     """Sample GET request."""
     return Request(
@@ -40,7 +41,7 @@ def sample_request() -> Request:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def post_request() -> Request:
     """Sample POST request with JSON body."""
     return Request(
@@ -51,7 +52,7 @@ def post_request() -> Request:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_response() -> Response:
     """Sample successful response."""
     return Response(
@@ -64,7 +65,7 @@ def sample_response() -> Response:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def error_response() -> Response:
     """Sample error response."""
     return Response(
@@ -78,128 +79,114 @@ def error_response() -> Response:
 
 # ============== Mock Backend Fixtures ==============
 
-@pytest.fixture
-def mock_httpx_backend() -> MagicMock:
-    """Mock httpx backend for testing without network."""
-    backend = MagicMock()
-
-    # Default successful response
-    backend.request_sync.return_value = Response(
-        status_code=200,
-        headers={"Content-Type": "text/html"},
-        content=b"<html>OK</html>",
-        url="https://example.com",
-        elapsed=0.1,
-    )
-
-    # Async version
-    async def async_request(*args, **kwargs):
-        return backend.request_sync.return_value
-
-    backend.request_async = AsyncMock(side_effect=async_request)
+# Canned backend responses, built once and shared by every mock backend;
+# tests replace return_value rather than mutating these
+_OK_RESPONSE = Response(
+    status_code=200,
+    headers={"Content-Type": "text/html"},
+    content=b"<html>OK</html>",
+    url="https://example.com",
+    elapsed=0.1,
+)
+
+_COOKIE_RESPONSE = Response(
+    status_code=200,
+    headers={"Content-Type": "text/html", "Set-Cookie": "session=abc123"},
+    content=b"<html>OK</html>",
+    url="https://example.com",
+    cookies={"session": "abc123", "user": "testuser"},
+    elapsed=0.1,
+)
+
+
+def _make_backend(spec: type, response: Response) -> MagicMock:
+    """Build a mock backend returning response from both request methods."""
+    backend = MagicMock(spec=spec)
+    backend.request_sync.return_value = response
+    backend.request_async = AsyncMock(return_value=response)
     backend.close_sync = MagicMock()
     backend.close_async = AsyncMock()
-
     return backend
 
 
+@pytest.fixture
+def mock_httpx_backend() -> MagicMock:
+    """Mock httpx backend for testing without network."""
+    return _make_backend(HttpxBackend, _OK_RESPONSE)
+
+
 @pytest.fixture
 def mock_curl_backend() -> MagicMock:
     """Mock curl backend for testing without network."""
-    backend = MagicMock()
+    return _make_backend(CurlBackend, _OK_RESPONSE)
 
-    # Default successful response
-    backend.request_sync.return_value = Response(
-        status_code=200,
-        headers={"Content-Type": "text/html"},
-        content=b"<html>OK</html>",
-        url="https://example.com",
-        elapsed=0.1,
-    )
 
-    # Async version
-    async def async_request(*args, **kwargs):
-        return backend.request_sync.return_value
+@pytest.fixture
+def mock_backend_with_cookies() -> MagicMock:
+    """Mock backend that returns cookies."""
+    return _make_backend(HttpxBackend, _COOKIE_RESPONSE)
 
-    backend.request_async = AsyncMock(side_effect=async_request)
-    backend.close_sync = MagicMock()
-    backend.close_async = AsyncMock()
 
-    return backend
+@pytest.fixture
+def patched_httpx_backend(
+    mock_httpx_backend: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Route HTTPClient's httpx backend to mock_httpx_backend."""
+    monkeypatch.setattr(client_module, "HttpxBackend", lambda **kwargs: mock_httpx_backend)
 
 
 @pytest.fixture
-def mock_backend_with_cookies() -> MagicMock:
-    """Mock backend that returns cookies."""
-    backend = MagicMock()
-
-    backend.request_sync.return_value = Response(
-        status_code=200,
-        headers={"Content-Type": "text/html", "Set-Cookie": "session=abc123"},
-        content=b"<html>OK</html>",
-        url="https://example.com",
-        cookies={"session": "abc123", "user": "testuser"},
-        elapsed=0.1,
+def patched_cookie_backend(
+    mock_backend_with_cookies: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Route HTTPClient's httpx backend to mock_backend_with_cookies."""
+    monkeypatch.setattr(
+        client_module, "HttpxBackend", lambda **kwargs: mock_backend_with_cookies
     )
 
-    async def async_request(*args, **kwargs):
-        return backend.request_sync.return_value
 
-    backend.request_async = AsyncMock(side_effect=async_request)
-    backend.close_sync = MagicMock()
-    backend.close_async = AsyncMock()
-
-    return backend
+@pytest.fixture
+def patched_backends(
+    patched_httpx_backend: None,
+    mock_curl_backend: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Route HTTPClient's httpx and curl backends to the mock backends."""
+    monkeypatch.setattr(client_module, "CurlBackend", lambda **kwargs: mock_curl_backend)
+    monkeypatch.setattr(client_module, "CURL_AVAILABLE", True)
 
 
 # ============== Client Fixtures ==============
 
+# Clients wrap mock backends only, so there is nothing to close on teardown.
+
 @pytest.fixture
-def client(mock_httpx_backend: MagicMock) -> Generator[HTTPClient, None, None]:
+def client(patched_httpx_backend: None) -> HTTPClient:
     """HTTPClient with mocked httpx backend."""
-    with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-        client = HTTPClient()
-        yield client
-        client.close()
+    return HTTPClient()
 
 
 @pytest.fixture
-def client_with_cookies(mock_backend_with_cookies: MagicMock) -> Generator[HTTPClient, None, None]:
+def client_with_cookies(patched_cookie_backend: None) -> HTTPClient:
     """HTTPClient with cookie persistence enabled."""
-    with patch("http_client.client.HttpxBackend", return_value=mock_backend_with_cookies):
-        client = HTTPClient(persist_cookies=True)
-        yield client
-        client.close()
+    return HTTPClient(persist_cookies=True)
 
 
 @pytest.fixture
-async def async_client(mock_httpx_backend: MagicMock) -> AsyncGenerator[HTTPClient, None]:
+def async_client(patched_httpx_backend: None) -> HTTPClient:
     """Async HTTPClient with mocked backend."""
-    with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-        client = HTTPClient()
-        yield client
-        await client.close_async()
+    return HTTPClient()
 
 
 # ============== URL Fixtures ==============
 
-@pytest.fixture
-def test_urls() -> list[str]:
-    """List of test URLs."""
-    return [
+@pytest.fixture(scope="session")
+def test_urls() -> tuple[str, ...]:
+    """Test URLs (read-only, shared across tests)."""
+    return (
         "https://example.com/page1",
         "https://example.com/page2",
         "https://example.com/page3",
         "https://other.com/page1",
         "https://other.com/page2",
-    ]
-
-
-# ============== Event Loop Fixture ==============
-
-@pytest.fixture
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+    )
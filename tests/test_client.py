@@ -1,304 +1,416 @@
 """Tests for HTTPClient."""
 
-from unittest.mock import MagicMock, patch, AsyncMock
+from unittest.mock import MagicMock, AsyncMock
 
 import pytest
 
+from http_client import client as client_module
 from http_client import (
     HTTPClient,
+    MaxRetriesExceeded,
+    Request,
     Response,
     TransportError,
 )
 
 
+# (method, url, kwargs) for the plain HTTP method helpers
+_HTTP_METHOD_CASES = (
+    ("get", "https://example.com", {}),
+    ("post", "https://example.com/api", {"json": {"key": "value"}}),
+    ("put", "https://example.com/api/1", {"json": {"key": "updated"}}),
+    ("put", "https://example.com/api/1", {"data": {"key": "updated"}}),
+    ("delete", "https://example.com/api/1", {}),
+    ("patch", "https://example.com/api/1", {"json": {"key": "patched"}}),
+    ("head", "https://example.com", {}),
+    ("options", "https://example.com", {}),
+)
+_HTTP_METHOD_IDS = ("get", "post", "put-json", "put-data", "delete", "patch", "head", "options")
+
+
 class TestHTTPClientInit:
     """Tests for HTTPClient initialization."""
 
-    def test_init_defaults(self, mock_httpx_backend):
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_init_defaults(self):
         """Test client initialization with defaults."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-            client = HTTPClient()
+        client = HTTPClient()
 
-            assert client._default_backend == "httpx"
-            assert client._cookie_store is None
-            assert client._timeout == 30.0
-            assert client._verify_ssl is True
-            assert client._proxy is None
-            assert client._follow_redirects is True
-            assert client._profile == "chrome_120"
+        assert client._default_backend == "httpx"
+        assert client._cookie_store is None
+        assert client._timeout == 30.0
+        assert client._verify_ssl is True
+        assert client._proxy is None
+        assert client._follow_redirects is True
+        assert client._profile == "chrome_120"
 
-            client.close()
+        client.close()
 
-    def test_init_with_cookie_persistence(self, mock_httpx_backend):
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_init_with_cookie_persistence(self):
         """Test client initialization with cookie persistence."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-            client = HTTPClient(persist_cookies=True)
+        client = HTTPClient(persist_cookies=True)
 
-            assert client._cookie_store is not None
+        assert client._persist_cookies is True
+        # Store is created lazily on the first cookie-setting response
+        assert client._cookie_store is None
 
-            client.close()
+        client.close()
 
-    def test_init_with_curl_backend(self, mock_curl_backend):
+    @pytest.mark.usefixtures("patched_backends")
+    def test_init_with_curl_backend(self):
         """Test client initialization with curl backend."""
-        with patch("http_client.client.CurlBackend", return_value=mock_curl_backend):
-            with patch("http_client.client.CURL_AVAILABLE", True):
-                client = HTTPClient(default_backend="curl")
+        client = HTTPClient(default_backend="curl")
 
-                assert client._default_backend == "curl"
+        assert client._default_backend == "curl"
 
-                client.close()
+        client.close()
 
-    def test_init_with_custom_options(self, mock_httpx_backend):
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_init_with_custom_options(self):
         """Test client initialization with custom options."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-            client = HTTPClient(
-                timeout=60.0,
-                headers={"X-Custom": "value"},
-                verify_ssl=False,
-                proxy="http://proxy:8080",
-                follow_redirects=False,
-                profile="firefox_121",
-            )
+        client = HTTPClient(
+            timeout=60.0,
+            headers={"X-Custom": "value"},
+            verify_ssl=False,
+            proxy="http://proxy:8080",
+            follow_redirects=False,
+            profile="firefox_121",
+        )
 
-            assert client._timeout == 60.0
-            assert client._default_headers == {"X-Custom": "value"}
-            assert client._verify_ssl is False
-            assert client._proxy == "http://proxy:8080"
-            assert client._follow_redirects is False
-            assert client._profile == "firefox_121"
+        assert client._timeout == 60.0
+        assert client._default_headers == {"X-Custom": "value"}
+        assert client._verify_ssl is False
+        assert client._proxy == "http://proxy:8080"
+        assert client._follow_redirects is False
+        assert client._profile == "firefox_121"
 
-            client.close()
+        client.close()
+
+    def test_no_instance_dict(self, client):
+        """Test client uses __slots__ instead of a per-instance __dict__."""
+        assert not hasattr(client, "__dict__")
+
+        with pytest.raises(AttributeError):
+            client.unknown_attribute = "value"
 
 
 class TestHTTPClientSyncMethods:
     """Tests for synchronous client methods."""
 
-    def test_get(self, client, mock_httpx_backend):
-        """Test GET request."""
-        response = client.get("https://example.com")
+    @pytest.mark.parametrize(("method", "url", "kwargs"), _HTTP_METHOD_CASES, ids=_HTTP_METHOD_IDS)
+    def test_http_method(self, client, method, url, kwargs):
+        """Test each HTTP method helper dispatches and returns the response."""
+        response = getattr(client, method)(url, **kwargs)
 
         assert response.status_code == 200
 
-    def test_post(self, client, mock_httpx_backend):
-        """Test POST request."""
-        response = client.post(
-            "https://example.com/api",
-            json={"key": "value"},
-        )
+    def test_post_json_pre_encoded(self, client, mock_httpx_backend, monkeypatch):
+        """Test json= bodies are encoded before dispatch when orjson is installed."""
+        monkeypatch.setattr(client_module, "ORJSON_AVAILABLE", True)
+        client.post("https://example.com/api", json={"key": "value"})
+
+        kwargs = mock_httpx_backend.request_sync.call_args.kwargs
+        assert kwargs["json"] is None
+        assert kwargs["data"] == b'{"key":"value"}'
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+    def test_post_json_passed_through_without_orjson(
+        self, client, mock_httpx_backend, monkeypatch
+    ):
+        """Test json= bodies are left to the backend without orjson."""
+        monkeypatch.setattr(client_module, "ORJSON_AVAILABLE", False)
+        client.post("https://example.com/api", json={"key": "value"})
+
+        kwargs = mock_httpx_backend.request_sync.call_args.kwargs
+        assert kwargs["json"] == {"key": "value"}
+        assert kwargs["data"] is None
+
+    @pytest.mark.parametrize("orjson_available", [True, False], ids=["orjson", "stdlib"])
+    def test_post_json_recorded_on_request(
+        self, client, mock_httpx_backend, monkeypatch, orjson_available
+    ):
+        """Test response.request keeps the caller's json= body either way."""
+        monkeypatch.setattr(client_module, "ORJSON_AVAILABLE", orjson_available)
+
+        def request_sync(**kwargs):
+            return Response(
+                status_code=200,
+                headers={},
+                content=b"",
+                url=kwargs["url"],
+                request=Request(
+                    method=kwargs["method"],
+                    url=kwargs["url"],
+                    data=kwargs["data"],
+                    json=kwargs["json"],
+                ),
+            )
+
+        mock_httpx_backend.request_sync.side_effect = request_sync
+        body = {"key": "value"}
+        response = client.post("https://example.com/api", json=body)
+
+        assert response.request.json == body
+        assert response.request.data is None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"headers": {"X-Custom": "value"}},
+            {"params": {"q": "test", "page": "1"}},
+            {"cookies": {"session": "abc123"}},
+            {"timeout": 5.0},
+            {"proxy": "http://proxy:8080"},
+        ],
+        ids=["headers", "params", "cookies", "timeout", "proxy"],
+    )
+    def test_request_with_options(self, client, kwargs):
+        """Test GET request with per-request options."""
+        response = client.get("https://example.com", **kwargs)
 
         assert response.status_code == 200
 
-    def test_put(self, client, mock_httpx_backend):
-        """Test PUT request."""
-        response = client.put(
-            "https://example.com/api/1",
-            json={"key": "updated"},
+    def test_get_json(self, client, mock_httpx_backend):
+        """Test get_json decodes the response body."""
+        mock_httpx_backend.request_sync.return_value = Response(
+            status_code=200,
+            headers={"Content-Type": "application/json"},
+            content=b'{"success": true, "items": [1, 2]}',
+            url="https://example.com/api",
         )
 
-        assert response.status_code == 200
+        data = client.get_json("https://example.com/api")
 
-    def test_delete(self, client, mock_httpx_backend):
-        """Test DELETE request."""
-        response = client.delete("https://example.com/api/1")
-
-        assert response.status_code == 200
+        assert data == {"success": True, "items": [1, 2]}
+        assert client.get_status_code() == 200
 
-    def test_patch(self, client, mock_httpx_backend):
-        """Test PATCH request."""
-        response = client.patch(
-            "https://example.com/api/1",
-            json={"key": "patched"},
+    def test_stream(self, client, mock_httpx_backend):
+        """Test stream yields backend chunks and records the response."""
+        mock_httpx_backend.stream_sync.return_value = (
+            Response(
+                status_code=200,
+                headers={"Content-Length": "2"},
+                content=b"",
+                url="https://example.com/file",
+            ),
+            iter([b"a", b"b"]),
         )
 
-        assert response.status_code == 200
-
-    def test_head(self, client, mock_httpx_backend):
-        """Test HEAD request."""
-        response = client.head("https://example.com")
-
-        assert response.status_code == 200
+        chunks = list(client.stream("https://example.com/file", chunk_size=1))
 
-    def test_options(self, client, mock_httpx_backend):
-        """Test OPTIONS request."""
-        response = client.options("https://example.com")
+        assert chunks == [b"a", b"b"]
+        assert client.get_status_code() == 200
+        assert mock_httpx_backend.stream_sync.call_args.kwargs["chunk_size"] == 1
 
-        assert response.status_code == 200
+    def test_stream_sends_on_call(self, client, mock_httpx_backend):
+        """Test stream sends the request and raises errors before iteration."""
+        mock_httpx_backend.stream_sync.side_effect = TransportError("Connection failed")
 
-    def test_request_with_headers(self, client, mock_httpx_backend):
-        """Test request with custom headers."""
-        response = client.get(
-            "https://example.com",
-            headers={"X-Custom": "value"},
-        )
+        with pytest.raises(TransportError):
+            client.stream("https://example.com/file")
 
-        assert response.status_code == 200
+        client.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            client.stream("https://example.com/file")
 
-    def test_request_with_params(self, client, mock_httpx_backend):
-        """Test request with query parameters."""
-        response = client.get(
-            "https://example.com/search",
-            params={"q": "test", "page": "1"},
-        )
+    def test_stream_records_proxy_health(self, client, mock_httpx_backend):
+        """Test stream rotates proxies and records proxy outcomes."""
 
-        assert response.status_code == 200
+        def broken_body():
+            yield b"a"
+            raise TransportError("Connection reset")
 
-    def test_request_with_cookies(self, client, mock_httpx_backend):
-        """Test request with cookies."""
-        response = client.get(
-            "https://example.com",
-            cookies={"session": "abc123"},
+        mock_httpx_backend.stream_sync.return_value = (
+            Response(status_code=200, headers={}, content=b"", url="https://example.com/file"),
+            broken_body(),
         )
+        client.set_proxy(proxies=["http://p1:8080", "http://p2:8080"])
 
-        assert response.status_code == 200
-
-    def test_request_with_timeout(self, client, mock_httpx_backend):
-        """Test request with custom timeout."""
-        response = client.get(
-            "https://example.com",
-            timeout=5.0,
-        )
+        chunks = client.stream("https://example.com/file", rotate_proxy=True)
+        assert mock_httpx_backend.stream_sync.call_args.kwargs["proxy"] == "http://p2:8080"
+        with pytest.raises(TransportError):
+            list(chunks)
 
-        assert response.status_code == 200
+        health = client.proxy_manager.get_health("http://p2:8080")
+        assert health.total_requests == 2
+        assert health.total_failures == 1
 
-    def test_request_with_proxy(self, client, mock_httpx_backend):
-        """Test request with specific proxy."""
-        response = client.get(
-            "https://example.com",
-            proxy="http://proxy:8080",
-        )
+    def test_request_with_zero_timeout_not_replaced(self, client, mock_httpx_backend):
+        """Test timeout=0 is passed through instead of falling back to default."""
+        client.get("https://example.com", timeout=0)
 
-        assert response.status_code == 200
+        assert mock_httpx_backend.request_sync.call_args.kwargs["timeout"] == 0
 
 
 class TestHTTPClientAsyncMethods:
     """Tests for asynchronous client methods."""
 
     @pytest.mark.asyncio
-    async def test_get_async(self, async_client, mock_httpx_backend):
-        """Test async GET request."""
-        response = await async_client.get_async("https://example.com")
+    @pytest.mark.parametrize(("method", "url", "kwargs"), _HTTP_METHOD_CASES, ids=_HTTP_METHOD_IDS)
+    async def test_http_method_async(self, async_client, method, url, kwargs):
+        """Test each async HTTP method helper dispatches and returns the response."""
+        response = await getattr(async_client, f"{method}_async")(url, **kwargs)
 
         assert response.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_post_async(self, async_client, mock_httpx_backend):
-        """Test async POST request."""
-        response = await async_client.post_async(
-            "https://example.com/api",
-            json={"key": "value"},
+    async def test_get_json_async(self, async_client, mock_httpx_backend):
+        """Test async get_json decodes the response body."""
+        mock_httpx_backend.request_async.return_value = Response(
+            status_code=200,
+            headers={"Content-Type": "application/json"},
+            content=b'{"success": true}',
+            url="https://example.com/api",
         )
 
-        assert response.status_code == 200
+        data = await async_client.get_json_async("https://example.com/api")
 
-    @pytest.mark.asyncio
-    async def test_put_async(self, async_client, mock_httpx_backend):
-        """Test async PUT request."""
-        response = await async_client.put_async(
-            "https://example.com/api/1",
-            data={"key": "updated"},
-        )
+        assert data == {"success": True}
 
-        assert response.status_code == 200
 
-    @pytest.mark.asyncio
-    async def test_delete_async(self, async_client, mock_httpx_backend):
-        """Test async DELETE request."""
-        response = await async_client.delete_async("https://example.com/api/1")
-
-        assert response.status_code == 200
+class TestHTTPClientBatchRequests:
+    """Tests for request_many_async."""
 
     @pytest.mark.asyncio
-    async def test_patch_async(self, async_client, mock_httpx_backend):
-        """Test async PATCH request."""
-        response = await async_client.patch_async(
-            "https://example.com/api/1",
-            json={"key": "patched"},
+    async def test_request_many_async(self, async_client, mock_httpx_backend):
+        """Test batch returns responses in spec order."""
+        result = await async_client.request_many_async(
+            [
+                {"url": "https://example.com/1"},
+                {"url": "https://example.com/2", "method": "POST", "json": {"k": "v"}},
+                {"url": "https://example.com/3", "headers": {"X-Custom": "value"}},
+            ]
         )
 
-        assert response.status_code == 200
+        assert result.all_succeeded
+        assert result.success_count == 3
+        assert mock_httpx_backend.request_async.await_count == 3
+        last_call = mock_httpx_backend.request_async.call_args_list[-1]
+        assert last_call.kwargs["headers"] == {"X-Custom": "value"}
 
     @pytest.mark.asyncio
-    async def test_head_async(self, async_client, mock_httpx_backend):
-        """Test async HEAD request."""
-        response = await async_client.head_async("https://example.com")
+    async def test_request_many_async_error_isolation(
+        self, async_client, mock_httpx_backend
+    ):
+        """Test a failing request does not affect the rest of the batch."""
+        ok_response = mock_httpx_backend.request_sync.return_value
+
+        async def request_async(**kwargs):
+            if kwargs["url"].endswith("/bad"):
+                raise TransportError("Connection failed")
+            return ok_response
+
+        mock_httpx_backend.request_async.side_effect = request_async
+
+        result = await async_client.request_many_async(
+            [
+                {"url": "https://example.com/ok"},
+                {"url": "https://example.com/bad"},
+                {"url": "https://example.com/ok"},
+            ],
+            max_concurrency=2,
+        )
 
-        assert response.status_code == 200
+        assert result.success_count == 2
+        assert result.responses[1] is None
+        assert isinstance(result.errors[1], TransportError)
 
     @pytest.mark.asyncio
-    async def test_options_async(self, async_client, mock_httpx_backend):
-        """Test async OPTIONS request."""
-        response = await async_client.options_async("https://example.com")
+    async def test_request_many_async_proxy_fail_then_succeed(
+        self, async_client, mock_httpx_backend
+    ):
+        """Test proxy outcomes are recorded in completion order."""
+        ok_response = mock_httpx_backend.request_sync.return_value
+
+        async def request_async(**kwargs):
+            if kwargs["url"].endswith("/bad"):
+                raise TransportError("Connection failed")
+            return ok_response
+
+        mock_httpx_backend.request_async.side_effect = request_async
+        async_client.set_proxy(proxies=["http://p1:8080"])
+
+        await async_client.request_many_async(
+            [{"url": "https://example.com/bad"}] * 3 + [{"url": "https://example.com/ok"}],
+            max_concurrency=1,
+        )
 
-        assert response.status_code == 200
+        health = async_client._proxy_manager.get_health("http://p1:8080")
+        assert health.total_failures == 3
+        assert health.is_healthy is True
+        assert health.cooldown_until is None
 
 
 class TestHTTPClientCookies:
     """Tests for cookie handling."""
 
-    def test_cookies_not_persisted_by_default(self, mock_backend_with_cookies):
+    @pytest.mark.usefixtures("patched_cookie_backend")
+    def test_cookies_not_persisted_by_default(self):
         """Test cookies are not persisted by default."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_backend_with_cookies):
-            client = HTTPClient()
+        client = HTTPClient()
 
-            # Cookie store should be None
-            assert client._cookie_store is None
+        # Cookie store should be None
+        assert client._cookie_store is None
 
-            # First request returns cookies
-            response = client.get("https://example.com/login")
-            assert len(response.cookies) > 0
+        # First request returns cookies
+        response = client.get("https://example.com/login")
+        assert len(response.cookies) > 0
+        assert client._cookie_store is None
 
-            client.close()
+        client.close()
 
-    def test_cookies_persisted_when_enabled(self, mock_backend_with_cookies):
+    @pytest.mark.usefixtures("patched_cookie_backend")
+    def test_cookies_persisted_when_enabled(self):
         """Test cookies are persisted when enabled."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_backend_with_cookies):
-            client = HTTPClient(persist_cookies=True)
+        client = HTTPClient(persist_cookies=True)
 
-            # Cookie store should exist
-            assert client._cookie_store is not None
+        # Cookie store is not created until cookies arrive
+        assert client._cookie_store is None
 
-            # First request sets cookies
-            response = client.get("https://example.com/login")
+        # First request sets cookies
+        response = client.get("https://example.com/login")
 
-            # Response should have cookies
-            assert len(response.cookies) > 0
+        # Response should have cookies
+        assert len(response.cookies) > 0
+        assert client._cookie_store is not None
 
-            # Cookies should be stored (verify via cookie store directly)
-            stored_cookies = client._cookie_store.get_for_url("https://example.com")
-            assert len(stored_cookies) > 0
-            assert "session" in stored_cookies
+        # Cookies should be stored (verify via cookie store directly)
+        stored_cookies = client._cookie_store.get_for_url("https://example.com")
+        assert len(stored_cookies) > 0
+        assert "session" in stored_cookies
 
-            client.close()
+        client.close()
 
-    def test_clear_cookies(self, mock_backend_with_cookies):
+    @pytest.mark.usefixtures("patched_cookie_backend")
+    def test_clear_cookies(self):
         """Test clearing cookies."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_backend_with_cookies):
-            client = HTTPClient(persist_cookies=True)
+        client = HTTPClient(persist_cookies=True)
 
-            # Set some cookies
-            client.get("https://example.com")
+        # Set some cookies
+        client.get("https://example.com")
 
-            # Clear all cookies
-            client.clear_cookies()
+        # Clear all cookies
+        client.clear_cookies()
 
-            assert client.cookies == {}
+        assert client.cookies == {}
 
-            client.close()
+        client.close()
 
-    def test_clear_cookies_by_domain(self, mock_backend_with_cookies):
+    @pytest.mark.usefixtures("patched_cookie_backend")
+    def test_clear_cookies_by_domain(self):
         """Test clearing cookies for specific domain."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_backend_with_cookies):
-            client = HTTPClient(persist_cookies=True)
+        client = HTTPClient(persist_cookies=True)
 
-            # Set some cookies
-            client.get("https://example.com")
+        # Set some cookies
+        client.get("https://example.com")
 
-            # Clear cookies for domain
-            client.clear_cookies("example.com")
+        # Clear cookies for domain
+        client.clear_cookies("example.com")
 
-            assert client.cookies.get("example.com", {}) == {}
+        assert client.cookies.get("example.com", {}) == {}
 
-            client.close()
+        client.close()
 
 
 class TestHTTPClientHelpers:
@@ -332,14 +444,23 @@ class TestHTTPClientHelpers:
         cookies = client.get_cookies()
         assert cookies is not None
 
-    def test_get_current_proxy(self, mock_httpx_backend):
+    def test_get_headers_read_only(self, client, mock_httpx_backend):
+        """Test get_headers returns a read-only view of the last response."""
+        client.get("https://example.com")
+        headers = client.get_headers()
+
+        assert headers == {"Content-Type": "text/html"}
+        with pytest.raises(TypeError):
+            headers["X-New"] = "value"
+
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_get_current_proxy(self):
         """Test get_current_proxy helper."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-            client = HTTPClient(proxy="http://proxy:8080")
+        client = HTTPClient(proxy="http://proxy:8080")
 
-            assert client.get_current_proxy() == "http://proxy:8080"
+        assert client.get_current_proxy() == "http://proxy:8080"
 
-            client.close()
+        client.close()
 
     def test_get_elapsed(self, client, mock_httpx_backend):
         """Test get_elapsed helper."""
@@ -381,6 +502,33 @@ class TestHTTPClientHeaderManagement:
         """Test removing nonexistent header doesn't raise."""
         client.remove_default_header("X-NonExistent")  # Should not raise
 
+    def test_default_header_changes_apply_to_next_request(self, client, mock_httpx_backend):
+        """Test default-header changes apply to the next request."""
+        client.get("https://example.com")
+        assert mock_httpx_backend.request_sync.call_args.kwargs["headers"] == {}
+
+        client.set_default_header("X-Custom", "value")
+        client.get("https://example.com")
+        assert mock_httpx_backend.request_sync.call_args.kwargs["headers"] == {
+            "X-Custom": "value"
+        }
+
+        client.remove_default_header("X-Custom")
+        client.get("https://example.com")
+        assert mock_httpx_backend.request_sync.call_args.kwargs["headers"] == {}
+
+    def test_request_headers_not_shared_with_defaults(self, client, mock_httpx_backend):
+        """Test mutating a sent headers dict does not leak into later requests."""
+        client.set_default_header("X-Custom", "value")
+        client.get("https://example.com")
+        mock_httpx_backend.request_sync.call_args.kwargs["headers"]["X-Leak"] = "1"
+
+        client.get("https://example.com")
+
+        assert mock_httpx_backend.request_sync.call_args.kwargs["headers"] == {
+            "X-Custom": "value"
+        }
+
 
 class TestHTTPClientProxyManagement:
     """Tests for proxy management."""
@@ -402,136 +550,269 @@ class TestHTTPClientProxyManagement:
 class TestHTTPClientContextManager:
     """Tests for context manager support."""
 
-    def test_sync_context_manager(self, mock_httpx_backend):
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_sync_context_manager(self):
         """Test sync context manager."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-            with HTTPClient() as client:
-                response = client.get("https://example.com")
-                assert response.status_code == 200
+        with HTTPClient() as client:
+            response = client.get("https://example.com")
+            assert response.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_async_context_manager(self, mock_httpx_backend):
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    async def test_async_context_manager(self):
         """Test async context manager."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-            async with HTTPClient() as client:
-                response = await client.get_async("https://example.com")
-                assert response.status_code == 200
+        async with HTTPClient() as client:
+            response = await client.get_async("https://example.com")
+            assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("patched_backends")
+    async def test_close_async_closes_all_used_backends(
+        self, mock_httpx_backend, mock_curl_backend
+    ):
+        """Test close_async closes every backend that was created."""
+        client = HTTPClient()
+        await client.get_async("https://example.com")
+        await client.get_async("https://example.com", backend="curl")
+
+        await client.close_async()
+
+        mock_httpx_backend.close_async.assert_awaited_once()
+        mock_curl_backend.close_async.assert_awaited_once()
 
 
 class TestHTTPClientBackendSwitching:
     """Tests for per-request backend switching."""
 
+    @pytest.mark.usefixtures("patched_httpx_backend")
     def test_default_backend_httpx(self, mock_httpx_backend):
         """Test default backend is httpx."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-            client = HTTPClient()
+        client = HTTPClient()
 
-            # Should use httpx by default
-            client.get("https://example.com")
+        # Should use httpx by default
+        client.get("https://example.com")
 
-            assert mock_httpx_backend.request_sync.called
+        mock_httpx_backend.request_sync.assert_called_once()
 
-            client.close()
+        client.close()
 
-    def test_switch_to_curl_backend(self, mock_httpx_backend, mock_curl_backend):
+    @pytest.mark.usefixtures("patched_backends")
+    def test_switch_to_curl_backend(self, mock_curl_backend):
         """Test switching to curl backend per request."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-            with patch("http_client.client.CurlBackend", return_value=mock_curl_backend):
-                with patch("http_client.client.CURL_AVAILABLE", True):
-                    client = HTTPClient()
+        client = HTTPClient()
 
-                    # Switch to curl for this request
-                    client.get("https://example.com", backend="curl")
+        # Switch to curl for this request
+        client.get("https://example.com", backend="curl")
 
-                    assert mock_curl_backend.request_sync.called
+        mock_curl_backend.request_sync.assert_called_once()
 
-                    client.close()
+        client.close()
 
-    def test_stealth_mode_curl(self, mock_httpx_backend, mock_curl_backend):
+    @pytest.mark.usefixtures("patched_backends")
+    def test_stealth_mode_curl(self, mock_curl_backend):
         """Test stealth mode with curl backend."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-            with patch("http_client.client.CurlBackend", return_value=mock_curl_backend):
-                with patch("http_client.client.CURL_AVAILABLE", True):
-                    client = HTTPClient()
+        client = HTTPClient()
 
-                    # Use stealth mode
-                    client.get("https://example.com", backend="curl", stealth=True)
+        # Use stealth mode
+        client.get("https://example.com", backend="curl", stealth=True)
 
-                    # Verify curl backend was called with stealth=True
-                    call_kwargs = mock_curl_backend.request_sync.call_args[1]
-                    assert call_kwargs.get("stealth") is True
+        # Verify curl backend was called with stealth=True
+        call_kwargs = mock_curl_backend.request_sync.call_args[1]
+        assert call_kwargs.get("stealth") is True
 
-                    client.close()
+        client.close()
 
 
 class TestHTTPClientErrorHandling:
     """Tests for error handling."""
 
-    def test_closed_client_raises_error(self, mock_httpx_backend):
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_closed_client_raises_error(self):
         """Test that using closed client raises RuntimeError."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-            client = HTTPClient()
-            client.close()
+        client = HTTPClient()
+        client.close()
 
-            with pytest.raises(RuntimeError, match="Client is closed"):
-                client.get("https://example.com")
+        with pytest.raises(RuntimeError, match="Client is closed"):
+            client.get("https://example.com")
 
+    @pytest.mark.usefixtures("patched_httpx_backend")
     def test_transport_error_propagates(self, mock_httpx_backend):
         """Test transport error is propagated."""
         mock_httpx_backend.request_sync.side_effect = TransportError("Connection failed")
 
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-            client = HTTPClient()
+        client = HTTPClient()
 
-            with pytest.raises(TransportError):
-                client.get("https://example.com")
+        with pytest.raises(TransportError):
+            client.get("https://example.com")
 
-            client.close()
+        client.close()
 
-    def test_curl_not_available_raises(self, mock_httpx_backend):
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_curl_not_available_raises(self, monkeypatch):
         """Test error when curl is not available."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend):
-            with patch("http_client.client.CURL_AVAILABLE", False):
-                client = HTTPClient()
+        monkeypatch.setattr(client_module, "CURL_AVAILABLE", False)
+        client = HTTPClient()
+
+        with pytest.raises(ImportError, match="curl_cffi is required"):
+            client.get("https://example.com", backend="curl")
+
+        client.close()
 
-                with pytest.raises(ImportError, match="curl_cffi is required"):
-                    client.get("https://example.com", backend="curl")
 
-                client.close()
+class TestHTTPClientRetries:
+    """Tests for retry handling."""
+
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_default_retry_codes_shared(self):
+        """Test clients share one default retry-code set."""
+        first = HTTPClient()
+        second = HTTPClient()
+        custom = HTTPClient(retry_codes=[503])
+
+        assert first._retry_codes is second._retry_codes
+        assert custom._retry_codes == frozenset({503})
+
+        first.close()
+        second.close()
+        custom.close()
+
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_retry_on_status_code(
+        self,
+        mock_httpx_backend,
+        error_response,
+        sample_response,
+        monkeypatch,
+    ):
+        """Test retryable status codes are retried until success."""
+        mock_httpx_backend.request_sync.side_effect = [error_response, sample_response]
+
+        mock_sleep = MagicMock()
+        monkeypatch.setattr(client_module.time, "sleep", mock_sleep)
+        client = HTTPClient(max_retries=2, retry_backoff=0.1)
+
+        response = client.get("https://example.com")
+
+        assert response.status_code == 200
+        assert mock_httpx_backend.request_sync.call_count == 2
+        mock_sleep.assert_called_once_with(0.1)
+
+        client.close()
+
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_retries_exhausted_raises(self, mock_httpx_backend, monkeypatch):
+        """Test MaxRetriesExceeded after repeated transport errors."""
+        mock_httpx_backend.request_sync.side_effect = TransportError("Connection failed")
+
+        monkeypatch.setattr(client_module.time, "sleep", MagicMock())
+        client = HTTPClient(max_retries=2)
+
+        with pytest.raises(MaxRetriesExceeded) as exc_info:
+            client.get("https://example.com")
+
+        assert exc_info.value.attempts == 2
+        assert "Max retries (2)" in str(exc_info.value)
+        assert isinstance(exc_info.value.last_error, TransportError)
+
+        client.close()
+
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_non_idempotent_methods_not_retried(self, mock_httpx_backend, monkeypatch):
+        """Test POST is not retried unless listed in retry_methods."""
+        mock_httpx_backend.request_sync.side_effect = TransportError("Connection failed")
+        monkeypatch.setattr(client_module.time, "sleep", MagicMock())
+
+        client = HTTPClient(max_retries=2)
+        with pytest.raises(TransportError):
+            client.post("https://example.com/api", json={"key": "value"})
+        assert mock_httpx_backend.request_sync.call_count == 1
+        client.close()
+
+        client = HTTPClient(max_retries=2, retry_methods=["post"])
+        with pytest.raises(MaxRetriesExceeded):
+            client.post("https://example.com/api", json={"key": "value"})
+        assert mock_httpx_backend.request_sync.call_count == 4
+        client.close()
+
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_negative_max_retries_rejected(self):
+        """Test a negative max_retries raises instead of disabling retries."""
+        with pytest.raises(ValueError, match="max_retries"):
+            HTTPClient(max_retries=-1)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    async def test_retry_async_uses_asyncio_sleep(
+        self,
+        mock_httpx_backend,
+        error_response,
+        sample_response,
+        monkeypatch,
+    ):
+        """Test async retries back off without blocking the event loop."""
+        mock_httpx_backend.request_async = AsyncMock(
+            side_effect=[error_response, error_response, sample_response]
+        )
+
+        mock_sleep = AsyncMock()
+        monkeypatch.setattr(client_module.asyncio, "sleep", mock_sleep)
+        mock_time_sleep = MagicMock()
+        monkeypatch.setattr(client_module.time, "sleep", mock_time_sleep)
+        client = HTTPClient(max_retries=3, retry_backoff=0.5)
+
+        response = await client.get_async("https://example.com")
+
+        assert response.status_code == 200
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [0.5, 1.0]
+        mock_time_sleep.assert_not_called()
+
+        await client.close_async()
 
 
 class TestHTTPClientLazyBackendInit:
     """Tests for lazy backend initialization."""
 
-    def test_httpx_backend_lazy_init(self, mock_httpx_backend):
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_httpx_backend_lazy_init(self):
         """Test httpx backend is lazily initialized."""
-        with patch("http_client.client.HttpxBackend", return_value=mock_httpx_backend) as mock_class:
-            client = HTTPClient()
+        client = HTTPClient()
 
-            # Backend not created yet
-            assert client._httpx_backend is None
+        # Backend not created yet
+        assert client._httpx_backend is None
 
-            # Make request
-            client.get("https://example.com")
+        # Make request
+        client.get("https://example.com")
 
-            # Now backend should be created
-            assert client._httpx_backend is not None
+        # Now backend should be created
+        assert client._httpx_backend is not None
 
-            client.close()
+        client.close()
 
-    def test_curl_backend_lazy_init(self, mock_curl_backend):
+    @pytest.mark.usefixtures("patched_backends")
+    def test_curl_backend_lazy_init(self):
         """Test curl backend is lazily initialized."""
-        with patch("http_client.client.CurlBackend", return_value=mock_curl_backend) as mock_class:
-            with patch("http_client.client.CURL_AVAILABLE", True):
-                client = HTTPClient(default_backend="curl")
+        client = HTTPClient(default_backend="curl")
+
+        # Backend not created yet
+        assert client._curl_backend is None
+
+        # Make request
+        client.get("https://example.com")
 
-                # Backend not created yet
-                assert client._curl_backend is None
+        # Now backend should be created
+        assert client._curl_backend is not None
 
-                # Make request
-                client.get("https://example.com")
+        client.close()
+
+    @pytest.mark.usefixtures("patched_backends")
+    def test_curl_options_passed_to_backend(self, mock_curl_backend, monkeypatch):
+        """Test curl_options are forwarded to the curl backend."""
+        curl_class = MagicMock(return_value=mock_curl_backend)
+        monkeypatch.setattr(client_module, "CurlBackend", curl_class)
+        client = HTTPClient(default_backend="curl", curl_options={74: 1})
+
+        client.get("https://example.com")
 
-                # Now backend should be created
-                assert client._curl_backend is not None
+        assert curl_class.call_args.kwargs["curl_options"] == {74: 1}
 
-                client.close()
+        client.close()
@@ -4,6 +4,7 @@ import asyncio
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 
 import pytest
 
@@ -69,6 +70,28 @@ class TestCookie:
         assert cookie.matches_domain("api.example.com") is True
         assert cookie.matches_domain("other.com") is False
 
+    def test_matches_domain_after_domain_change(self):
+        """Test matching follows a reassigned domain."""
+        cookie = Cookie(name="session", value="abc", domain="example.com")
+        cookie.domain = ".Other.com"
+
+        assert cookie.matches_domain("www.other.com") is True
+        assert cookie.matches_domain("example.com") is False
+
+    def test_asdict_has_only_public_fields(self):
+        """Test asdict exposes only the declared cookie attributes."""
+        cookie = Cookie(name="session", value="abc", domain="example.com")
+
+        assert set(asdict(cookie)) == {
+            "name",
+            "value",
+            "domain",
+            "path",
+            "expires",
+            "secure",
+            "http_only",
+        }
+
     def test_matches_path(self):
         """Test path matching."""
         cookie = Cookie(name="session", value="abc", domain="example.com", path="/api")
@@ -114,6 +137,16 @@ class TestCookieStore:
 
         assert cookies == {"session": "abc123"}
 
+    def test_get_cookies_parent_domain(self):
+        """Test parent-domain cookies apply to subdomains, specific values win."""
+        store = CookieStore()
+        store.set("theme", "parent", domain=".example.com")
+        store.set("theme", "child", domain="api.example.com")
+        store.set("other", "x", domain="notexample.com")
+
+        assert store.get_for_url("https://api.example.com/") == {"theme": "child"}
+        assert store.get_for_url("https://www.example.com/") == {"theme": "parent"}
+
     def test_get_cookies_path_matching(self):
         """Test cookie path matching."""
         store = CookieStore()
@@ -171,6 +204,26 @@ class TestCookieStore:
         cookies = store.get_for_url("https://example.com")
         assert cookies == {"session": "abc", "user": "test"}
 
+    def test_expired_cookies_filtered_between_cleanups(self):
+        """Test expiry is honoured even when the periodic sweep is skipped."""
+        store = CookieStore()
+        store.set("short", "x", domain="example.com", expires=time.time() + 0.05)
+        store.set("other", "y", domain="other.com")
+        assert store.get_for_url("https://other.com") == {"other": "y"}
+
+        time.sleep(0.1)
+
+        assert store.get_for_url("https://example.com") == {}
+        assert store.get_all() == {"other.com": {"other": "y"}}
+
+    def test_update_from_response_without_cookies(self):
+        """Test an empty cookie update leaves the store untouched."""
+        store = CookieStore()
+        store.update_from_response("https://example.com/", {})
+
+        assert store._cookies == {}
+        assert store.get_for_url("https://example.com") == {}
+
     def test_delete_cookie(self):
         """Test deleting a specific cookie."""
         store = CookieStore()
@@ -233,6 +286,26 @@ class TestCookieStore:
         assert cookies == {"session": "new_value"}
         assert len(store) == 1
 
+    def test_cached_lookup_invalidated_on_update(self):
+        """Test repeated lookups see cookies added after the first lookup."""
+        store = CookieStore()
+        store.set("a", "1", domain="example.com")
+        assert store.get_for_url("https://example.com/page") == {"a": "1"}
+
+        store.update_from_response("https://example.com/", {"b": "2"})
+
+        assert store.get_for_url("https://example.com/page") == {"a": "1", "b": "2"}
+
+    def test_cached_lookup_respects_expiry(self):
+        """Test a cached lookup drops a cookie once it expires."""
+        store = CookieStore()
+        store.set("short", "x", domain="example.com", expires=time.time() + 0.05)
+        assert store.get_for_url("https://example.com") == {"short": "x"}
+
+        time.sleep(0.1)
+
+        assert store.get_for_url("https://example.com") == {}
+
     @pytest.mark.asyncio
     async def test_async_set(self):
         """Test async cookie setting."""
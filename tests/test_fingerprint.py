@@ -126,6 +126,11 @@ class TestProfilesRegistry:
         for name in expected:
             assert name in PROFILES
 
+    def test_registry_read_only(self):
+        """Test the shared registry cannot be modified."""
+        with pytest.raises(TypeError):
+            PROFILES["custom"] = CHROME_120
+
     def test_list_profiles(self):
         """Test listing all profile names."""
         names = list_profiles()
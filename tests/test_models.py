@@ -1,6 +1,7 @@
 """Tests for Request and Response models."""
 
 import json
+from unittest.mock import patch
 
 import pytest
 
@@ -42,6 +43,12 @@ class TestRequest:
         request = Request(method="Post", url="https://example.com")
         assert request.method == "POST"
 
+    def test_uppercase_method_not_copied(self):
+        """Test that an already-uppercase method string is kept as-is."""
+        method = "PATCH"
+        request = Request(method=method, url="https://example.com")
+        assert request.method is method
+
     def test_request_with_all_options(self):
         """Test request with all options set."""
         request = Request(
@@ -105,6 +112,12 @@ class TestResponse:
         assert response.request is None
         assert response.history == []
 
+    def test_response_uses_slots(self):
+        """Test Response instances carry no per-instance __dict__."""
+        response = Response(status_code=200, headers={}, content=b"", url="https://example.com")
+
+        assert not hasattr(response, "__dict__")
+
     def test_text_property(self):
         """Test text property decodes content."""
         response = Response(
@@ -116,6 +129,21 @@ class TestResponse:
 
         assert response.text == "Hello World"
 
+    def test_text_property_cached(self):
+        """Test text is decoded once and reused."""
+        response = Response(status_code=200, headers={}, content=b"Hello", url="https://example.com")
+
+        assert response.text is response.text
+
+    def test_text_follows_content_reassignment(self):
+        """Test reassigning content invalidates the cached text."""
+        response = Response(status_code=200, headers={}, content=b"aaa", url="https://example.com")
+        assert response.text == "aaa"
+
+        response.content = b"bbb"
+
+        assert response.text == "bbb"
+
     def test_text_property_unicode(self):
         """Test text property handles unicode."""
         response = Response(
@@ -173,6 +201,18 @@ class TestResponse:
         with pytest.raises(json.JSONDecodeError):
             response.json()
 
+    def test_json_method_without_orjson(self):
+        """Test JSON parsing falls back to the stdlib decoder."""
+        response = Response(
+            status_code=200,
+            headers={},
+            content=b'{"key": "value"}',
+            url="https://example.com",
+        )
+
+        with patch("http_client.models.ORJSON_AVAILABLE", False):
+            assert response.json() == {"key": "value"}
+
     def test_raise_for_status_success(self):
         """Test raise_for_status with success status."""
         response = Response(
@@ -284,6 +324,18 @@ class TestBatchResult:
         with pytest.raises(TransportError):
             result.raise_on_error()
 
+    def test_raise_on_error_lowest_index(self):
+        """Test raise_on_error raises the lowest-index error."""
+        first = TransportError("first")
+        result = BatchResult(
+            responses=[None, None, None],
+            errors={2: TransportError("third"), 0: first, 1: TransportError("second")},
+        )
+
+        with pytest.raises(TransportError) as exc_info:
+            result.raise_on_error()
+        assert exc_info.value is first
+
     def test_raise_on_error_success(self):
         """Test raise_on_error with no errors."""
         result = BatchResult(
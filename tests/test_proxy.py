@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -59,6 +60,17 @@ class TestProxyConfig:
         assert config.port == 1080
         assert config.protocol == ProxyProtocol.SOCKS5
 
+    def test_unknown_scheme_keeps_default_protocol(self):
+        config = ProxyConfig(url="socks5h://localhost:1080")
+        assert config.host == "localhost"
+        assert config.protocol == ProxyProtocol.HTTP
+
+    def test_frozen(self):
+        config = ProxyConfig(url="http://proxy.example.com:8080")
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.port = 9090
+
     def test_identifier(self):
         config = ProxyConfig(url="http://proxy:8080")
         assert config.identifier == "proxy:8080"
@@ -295,6 +307,7 @@ class TestProxyManager:
         manager.reset_proxy()
         assert not manager.has_proxy
         assert manager.get_current_proxy() is None
+        assert manager.get_health("http://p1:8080") is None
 
     def test_switch_proxy_round_robin(self):
         manager = ProxyManager()
@@ -337,6 +350,124 @@ class TestProxyManager:
         with pytest.raises(NoHealthyProxiesError):
             manager.switch_proxy()
 
+    def test_switch_proxy_recovers_after_cooldown(self):
+        manager = ProxyManager(max_failures=1, cooldown_seconds=0.05)
+        provider = GenericProvider(proxies=["http://p1:8080", "http://p2:8080"])
+        manager.add_provider(provider)
+        manager.set_proxy(provider="generic", count=2)
+
+        manager.record_failure("http://p1:8080", "Error")
+        manager.record_failure("http://p2:8080", "Error")
+        manager.record_success("http://p2:8080", 0.1)  # p2's heap entry goes stale
+        assert manager.get_stats().healthy_proxies == 1
+
+        time.sleep(0.1)
+
+        assert manager.get_stats().healthy_proxies == 2
+        assert manager.get_health("http://p1:8080").consecutive_failures == 0
+
+    def test_external_cooldown_recovers(self):
+        manager = ProxyManager()
+        provider = GenericProvider(proxies=["http://p1:8080"])
+        manager.add_provider(provider)
+        manager.set_proxy(provider="generic", count=1)
+
+        # Cooldown started on the health record directly, bypassing the manager
+        manager.get_health("http://p1:8080").record_failure(
+            "Error", max_failures=1, cooldown_seconds=0.05
+        )
+        assert manager.get_stats().healthy_proxies == 0
+        with pytest.raises(NoHealthyProxiesError):
+            manager.switch_proxy()
+
+        time.sleep(0.1)
+
+        assert manager.get_stats().healthy_proxies == 1
+        assert manager.switch_proxy().url == "http://p1:8080"
+
+    def test_recovery_heap_follows_pool(self):
+        manager = ProxyManager(max_failures=1, cooldown_seconds=60)
+        manager.add_provider(GenericProvider(proxies=["http://p1:8080", "http://p2:8080"]))
+        manager.set_proxy(provider="generic", count=2)
+        manager.record_failure("http://p1:8080", "Timeout")
+        manager.record_failure("http://p2:8080", "Timeout")
+        assert len(manager._recovery_heap) == 2
+
+        # p2 stays on cooldown in the new pool; p1's entry is dropped
+        manager.add_provider(GenericProvider(proxies=["http://p2:8080", "http://p3:8080"]))
+        manager.set_proxy(provider="generic", count=2)
+        p2_id = manager.get_health("http://p2:8080").proxy_id
+        assert [entry[2] for entry in manager._recovery_heap] == [p2_id]
+
+        manager.reset_proxy()
+        assert manager._recovery_heap == []
+
+    def test_next_proxy_url_round_robin(self):
+        manager = ProxyManager()
+        provider = GenericProvider(
+            proxies=["http://p1:8080", "http://p2:8080", "http://p3:8080"]
+        )
+        manager.add_provider(provider)
+        manager.set_proxy(provider="generic", count=3)
+
+        assert manager.next_proxy_url() == "http://p2:8080"
+        assert manager.next_proxy_url() == "http://p3:8080"
+        assert manager.next_proxy_url() == "http://p1:8080"  # Wraps around
+        assert manager.get_current_proxy() == "http://p1:8080"
+
+    def test_next_proxy_url_skips_unhealthy(self):
+        manager = ProxyManager(max_failures=1, cooldown_seconds=60)
+        provider = GenericProvider(
+            proxies=["http://p1:8080", "http://p2:8080", "http://p3:8080"]
+        )
+        manager.add_provider(provider)
+        manager.set_proxy(provider="generic", count=3)
+
+        manager.record_failure("http://p2:8080", "Connection refused")
+        assert manager.next_proxy_url() == "http://p3:8080"
+
+    def test_next_proxy_url_empty_pool(self):
+        manager = ProxyManager()
+        assert manager.next_proxy_url() is None
+
+    def test_next_proxy_url_concurrent_reset(self):
+        manager = ProxyManager()
+        provider = GenericProvider(proxies=["http://p1:8080", "http://p2:8080"])
+        manager.add_provider(provider)
+        manager.set_proxy(provider="generic", count=2)
+
+        class ResettingHealth(dict):
+            def get(self, key, default=None):
+                # reset_proxy() lands between the scan and the write-back
+                manager.reset_proxy()
+                return super().get(key, default)
+
+        manager._health = ResettingHealth(manager._health)
+
+        assert manager.next_proxy_url() is None
+        assert not manager.has_proxy
+        assert manager.get_current_proxy() is None
+
+    def test_next_proxy_url_concurrent_pool_replace(self):
+        manager = ProxyManager()
+        manager.add_provider(GenericProvider(proxies=["http://old1:8080", "http://old2:8080"]))
+        manager.set_proxy(provider="generic", count=2)
+        manager.add_provider(GenericProvider(proxies=["http://new1:8080", "http://new2:8080"]))
+        replaced = False
+
+        class ReplacingHealth(dict):
+            def get(self, key, default=None):
+                nonlocal replaced
+                if not replaced:
+                    replaced = True
+                    manager.set_proxy(provider="generic", count=2)
+                return super().get(key, default)
+
+        manager._health = ReplacingHealth(manager._health)
+
+        assert manager.next_proxy_url() == "http://new2:8080"
+        assert manager.get_current_proxy() == "http://new2:8080"
+
     def test_record_success(self):
         manager = ProxyManager()
         provider = GenericProvider(proxies=["http://p1:8080"])
@@ -360,6 +491,16 @@ class TestProxyManager:
         assert health is not None
         assert health.consecutive_failures == 1
 
+    def test_record_unknown_proxy_ignored(self):
+        manager = ProxyManager()
+        provider = GenericProvider(proxies=["http://p1:8080"])
+        manager.add_provider(provider)
+        manager.set_proxy(provider="generic")
+
+        manager.record_failure("http://other:8080", "Timeout")
+        assert manager.get_health("http://other:8080") is None
+        assert manager.get_health("http://p1:8080").consecutive_failures == 0
+
     def test_get_stats(self):
         manager = ProxyManager()
         provider = GenericProvider(proxies=["http://p1:8080", "http://p2:8080"])
@@ -470,6 +611,23 @@ class TestHTTPClientProxyIntegration:
         assert client.get_current_proxy() == "http://p2:8080"
         client.close()
 
+    @pytest.mark.usefixtures("patched_httpx_backend")
+    def test_rotate_proxy_per_request(self, mock_httpx_backend):
+        from http_client import HTTPClient
+
+        client = HTTPClient()
+        client.set_proxy(proxies=["http://p1:8080", "http://p2:8080"])
+
+        client.get("https://example.com", rotate_proxy=True)
+        assert mock_httpx_backend.request_sync.call_args.kwargs["proxy"] == "http://p2:8080"
+
+        client.get("https://example.com", rotate_proxy=True)
+        assert mock_httpx_backend.request_sync.call_args.kwargs["proxy"] == "http://p1:8080"
+
+        client.get("https://example.com")
+        assert mock_httpx_backend.request_sync.call_args.kwargs["proxy"] == "http://p1:8080"
+        client.close()
+
     def test_reset_proxy(self):
         from http_client import HTTPClient
 
@@ -580,6 +738,51 @@ class TestHTTPClientProxyIntegrationAsync:
         await client.close_async()
 
 
+# ========== httpx Backend Proxy Client Tests ==========
+
+
+class TestHttpxBackendProxyClients:
+    def test_evicted_sync_client_stays_usable(self, monkeypatch):
+        from http_client._backends import httpx_backend
+        from http_client._backends.httpx_backend import HttpxBackend
+
+        monkeypatch.setattr(httpx_backend, "_MAX_PROXY_CLIENTS", 1)
+        backend = HttpxBackend()
+        in_flight: dict[str, Any] = {}
+
+        # One thread holds the p1 client while another evicts it for p2
+        def take_p1() -> None:
+            in_flight["p1"] = backend._get_proxy_sync_client("http://p1:8080")
+
+        worker = threading.Thread(target=take_p1)
+        worker.start()
+        worker.join()
+        backend._get_proxy_sync_client("http://p2:8080")
+
+        p1_client = in_flight["p1"]
+        assert "http://p1:8080" not in backend._proxy_sync_clients
+        assert not p1_client.is_closed
+
+        backend.close_sync()
+        assert p1_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_evicted_async_client_stays_usable(self, monkeypatch):
+        from http_client._backends import httpx_backend
+        from http_client._backends.httpx_backend import HttpxBackend
+
+        monkeypatch.setattr(httpx_backend, "_MAX_PROXY_CLIENTS", 1)
+        backend = HttpxBackend()
+        p1_client = backend._get_proxy_async_client("http://p1:8080")
+        backend._get_proxy_async_client("http://p2:8080")
+
+        assert "http://p1:8080" not in backend._proxy_async_clients
+        assert not p1_client.is_closed
+
+        await backend.close_async()
+        assert p1_client.is_closed
+
+
 # ========== Exception Tests ==========
 
 